@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 # Check if Groq is available
 try:
-    from groq import Groq
+    from groq import Groq, AsyncGroq
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
@@ -22,10 +22,13 @@ class LLMActionItemExtractor:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        model: str = "llama-3.3-70b-versatile"
+        model: str = "llama-3.3-70b-versatile",
+        async_client: Optional["AsyncGroq"] = None
     ):
         self.model = model
         self.client = None
+        self._async_client = async_client
+        self._api_key = None
         self.enabled = False
         
         if not GROQ_AVAILABLE:
@@ -40,22 +43,26 @@ class LLMActionItemExtractor:
         
         try:
             self.client = Groq(api_key=key)
+            self._api_key = key
             self.enabled = True
             logger.info(f"LLM extractor initialized with {self.model}")
         except Exception as e:
             logger.error(f"Failed to initialize Groq client: {e}")
             self.enabled = False
     
+    @property
+    def async_client(self) -> "AsyncGroq":
+        """Async client, created on first async call."""
+        if self._async_client is None:
+            self._async_client = AsyncGroq(api_key=self._api_key)
+        return self._async_client
+    
     def extract_action_items(
         self,
         transcript_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         if not self.enabled:
-            return {
-                'status': 'error',
-                'message': 'LLM extraction not available',
-                'action_items': []
-            }
+            return self._unavailable_result()
         
         segments = transcript_data.get('transcript', [])
         
@@ -63,29 +70,63 @@ class LLMActionItemExtractor:
         conversation, segment_map = self._build_conversation_text_with_map(segments)
         
         # Extract speakers
-        speakers = list(set(seg.get('speaker', '').replace('Speaker_', '') 
-                           for seg in segments if seg.get('speaker')))
+        speakers = self.extract_speakers(segments)
         
         # Call LLM with few-shot examples
         try:
             action_items = self._extract_with_llm(conversation, speakers, segments, segment_map)
-            
-            return {
-                'status': 'success',
-                'action_items': action_items,
-                'total_items': len(action_items),
-                'extraction_method': 'llm_few_shot',
-                'model': self.model
-            }
+            return self._success_result(action_items)
         except Exception as e:
             logger.error(f"LLM extraction failed: {e}")
-            return {
-                'status': 'error',
-                'message': str(e),
-                'action_items': []
-            }
+            return self._error_result(e)
     
-    def _build_conversation_text(self, segments: List[Dict]) -> str:
+    async def aextract_action_items(
+        self,
+        transcript_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if not self.enabled:
+            return self._unavailable_result()
+        
+        segments = transcript_data.get('transcript', [])
+        conversation, segment_map = self._build_conversation_text_with_map(segments)
+        speakers = self.extract_speakers(segments)
+        
+        # Same extraction without blocking the event loop
+        try:
+            action_items = await self._aextract_with_llm(conversation, speakers, segments, segment_map)
+            return self._success_result(action_items)
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}")
+            return self._error_result(e)
+    
+    def extract_speakers(self, segments: List[Dict]) -> List[str]:
+        return list(set(seg.get('speaker', '').replace('Speaker_', '') 
+                        for seg in segments if seg.get('speaker')))
+    
+    def _success_result(self, action_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'status': 'success',
+            'action_items': action_items,
+            'total_items': len(action_items),
+            'extraction_method': 'llm_few_shot',
+            'model': self.model
+        }
+    
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        return {
+            'status': 'error',
+            'message': str(error),
+            'action_items': []
+        }
+    
+    def _unavailable_result(self) -> Dict[str, Any]:
+        return {
+            'status': 'error',
+            'message': 'LLM extraction not available',
+            'action_items': []
+        }
+    
+    def build_conversation_text(self, segments: List[Dict]) -> str:
         lines = []
         for seg in segments:
             speaker = seg.get('speaker', 'Unknown').replace('Speaker_', '')
@@ -115,11 +156,28 @@ class LLMActionItemExtractor:
         segment_map: Dict[int, int]
     ) -> List[Dict[str, Any]]:
         
+        request = self._build_request(conversation, speakers)
+        response = self.client.chat.completions.create(**request)
+        return self._parse_response(response, segments, conversation)
+    
+    async def _aextract_with_llm(
+        self,
+        conversation: str,
+        speakers: List[str],
+        segments: List[Dict],
+        segment_map: Dict[int, int]
+    ) -> List[Dict[str, Any]]:
+        
+        request = self._build_request(conversation, speakers)
+        response = await self.async_client.chat.completions.create(**request)
+        return self._parse_response(response, segments, conversation)
+    
+    def _build_request(self, conversation: str, speakers: List[str]) -> Dict[str, Any]:
         prompt = self._build_few_shot_prompt(conversation, speakers)
         
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+        return {
+            "model": self.model,
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are an expert at extracting action items from meeting transcripts. You identify tasks, assignees, deadlines, and start dates accurately."
@@ -129,10 +187,11 @@ class LLMActionItemExtractor:
                     "content": prompt
                 }
             ],
-            temperature=0.1,  # Low temperature for consistent extraction
-            max_tokens=2000
-        )
-        
+            "temperature": 0.1,  # Low temperature for consistent extraction
+            "max_tokens": 2000
+        }
+    
+    def _parse_response(self, response: Any, segments: List[Dict], conversation: str) -> List[Dict[str, Any]]:
         # Parse response
         try:
             result_text = response.choices[0].message.content.strip()
@@ -150,20 +209,27 @@ class LLMActionItemExtractor:
             result = json.loads(result_text)
             action_items = result.get('action_items', [])
             
-            # Post-process: clean, validate, and find speakers from transcript
-            cleaned_items = []
-            for item in action_items:
-                cleaned = self._clean_action_item(item, segments, conversation)
-                if cleaned:
-                    cleaned_items.append(cleaned)
-            
-            return cleaned_items
+            return self._clean_action_items(action_items, segments, conversation)
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {e}")
             logger.debug(f"Response text: {result_text}")
             return []
     
+    def action_items_result(self, action_items: List[Dict], segments: List[Dict], conversation: str) -> Dict[str, Any]:
+        """Clean action items parsed elsewhere (e.g. from a combined request) into an extraction result."""
+        return self._success_result(self._clean_action_items(action_items, segments, conversation))
+    
+    def _clean_action_items(self, action_items: List[Dict], segments: List[Dict], conversation: str) -> List[Dict[str, Any]]:
+        # Post-process: clean, validate, and find speakers from transcript
+        cleaned_items = []
+        for item in action_items:
+            cleaned = self._clean_action_item(item, segments, conversation)
+            if cleaned:
+                cleaned_items.append(cleaned)
+        
+        return cleaned_items
+    
     def _build_few_shot_prompt(
         self,
         conversation: str,
@@ -180,7 +246,16 @@ PARTICIPANTS: {speaker_list}
 TRANSCRIPT:
 {conversation}
 
-Extract all action items and return them as JSON in this exact format:
+{self.build_instructions(speakers)}
+
+Now extract action items from the given transcript above. Return ONLY the JSON, no additional text."""
+    
+    def build_instructions(self, speakers: List[str]) -> str:
+        """Output format, rules and few-shot examples of the extraction prompt."""
+        
+        speaker_list = ", ".join(speakers) if speakers else "unknown"
+        
+        return f"""Extract all action items and return them as JSON in this exact format:
 {{
   "action_items": [
     {{
@@ -304,9 +379,7 @@ OUTPUT:
       "confidence": 0.7
     }}
   ]
-}}
-
-Now extract action items from the given transcript above. Return ONLY the JSON, no additional text."""
+}}"""
     
     def _clean_action_item(self, item: Dict, segments: List[Dict], conversation: str) -> Optional[Dict]:
         description = item.get('description', '').strip()
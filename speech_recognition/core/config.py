@@ -5,6 +5,9 @@ Configuration constants for the speech recognition package.
 # Supported audio formats
 SUPPORTED_FORMATS = [".wav", ".mp3", ".ogg", ".flac", ".m4a", ".aac", ".mp4", ".webm", ".mkv", ".avi", ".mov"]
 
+# Formats librosa can decode natively (via libsndfile) without a pydub/ffmpeg conversion
+NATIVE_DECODE_FORMATS = [".wav", ".flac", ".ogg"]
+
 # tiny: ~1GB RAM, fastest
 # base: ~1GB RAM, good balance
 # small: ~2GB RAM, better accuracy
@@ -15,6 +18,13 @@ WHISPER_MODELS = ["tiny", "base", "small", "medium", "large", "large-v2", "large
 # Default Whisper model - "base" is fast and accurate enough for most cases
 DEFAULT_MODEL = "base"
 
+# whisper: openai-whisper (PyTorch)
+# faster-whisper: CTranslate2 with int8 quantization, 2-4x faster on CPU (optional dependency)
+WHISPER_BACKENDS = ["whisper", "faster-whisper"]
+
+# Default Whisper backend
+DEFAULT_BACKEND = "whisper"
+
 # Default language (None = auto-detect, "tr" for Turkish, "en" for English)
 DEFAULT_LANGUAGE = None
 
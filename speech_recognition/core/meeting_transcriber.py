@@ -3,14 +3,16 @@ Core implementation of the meeting transcriber with timestamp support.
 """
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Union, Optional, Any
 
-from speech_recognition.core.config import SUPPORTED_FORMATS, WHISPER_MODELS, DEFAULT_DIARIZATION_MODEL
+from speech_recognition.core.config import SUPPORTED_FORMATS, WHISPER_MODELS, DEFAULT_DIARIZATION_MODEL, DEFAULT_BACKEND
 from speech_recognition.models.whisper_model import WhisperTranscriber
 from speech_recognition.models.diarization_model import SpeakerDiarizer
 from speech_recognition.utils.audio_preprocessing import process_audio_file, detect_audio_issues
-from speech_recognition.utils.output_formatting import save_output, format_transcript, create_error_response
+from speech_recognition.utils.output_formatting import save_outputs, format_transcript, create_error_response
 from speech_recognition.utils.logging_setup import setup_logger
 
 logger = setup_logger()
@@ -31,7 +33,8 @@ class MeetingTranscriber:
             enable_speaker_diarization: bool = False,
             diarization_model: str = DEFAULT_DIARIZATION_MODEL,
             custom_vocabulary: List[str] = None,
-            include_timestamps: bool = True
+            include_timestamps: bool = True,
+            backend: str = DEFAULT_BACKEND
     ):
         """
         Initialize the MeetingTranscriber with Whisper and PyAnnote.
@@ -44,6 +47,7 @@ class MeetingTranscriber:
             diarization_model: PyAnnote model to use for speaker diarization
             custom_vocabulary: List of domain-specific terms to improve recognition
             include_timestamps: Whether to include timestamps in output (default: True)
+            backend: Whisper inference backend ("whisper" or "faster-whisper" for int8 CTranslate2)
         """
         self.language = language
         self.custom_vocabulary = custom_vocabulary
@@ -54,9 +58,14 @@ class MeetingTranscriber:
         self.transcriber = WhisperTranscriber(
             model_name=model_name,
             device=device,
-            language=language
+            language=language,
+            backend=backend
         )
 
+        # Model inference is serialized so batch workers can share one loaded model
+        self._inference_lock = threading.Lock()
+        self._diarization_lock = threading.Lock()
+
         # Initialize speaker diarization if requested
         self.diarizer = None
         if enable_speaker_diarization:
@@ -73,6 +82,7 @@ class MeetingTranscriber:
             output_format: str = "json",
             output_file: Optional[str] = None,
             segment_by_speaker: bool = False,
+            output_files: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """
         Transcribe an audio file to text using Whisper.
@@ -82,6 +92,7 @@ class MeetingTranscriber:
             output_format: Format for the output ("json", "txt", "srt", "vtt")
             output_file: Path to save the output file (optional)
             segment_by_speaker: Whether to segment by speaker (requires diarization)
+            output_files: Mapping of output format to file path, written in a single pass (optional)
 
         Returns:
             A dictionary with the transcript and metadata
@@ -114,16 +125,18 @@ class MeetingTranscriber:
             }
 
             # Perform transcription
-            result = self.transcriber.transcribe(audio_array, **whisper_options)
+            with self._inference_lock:
+                result = self.transcriber.transcribe(audio_array, **whisper_options)
 
             # Process speaker diarization if enabled and requested
             speaker_segments = None
             if self.enable_speaker_diarization and segment_by_speaker and self.diarizer:
                 logger.info("Processing speaker diarization")
-                speaker_segments = self.diarizer.process_audio(
-                    audio_file_path,
-                    result["segments"]
-                )
+                with self._diarization_lock:
+                    speaker_segments = self.diarizer.process_audio(
+                        audio_file_path,
+                        result["segments"]
+                    )
 
             # Format transcript (with timestamps)
             transcript = format_transcript(
@@ -146,9 +159,12 @@ class MeetingTranscriber:
                 "full_text": result["text"]
             }
 
-            # Save output to file if requested
+            # Save output to file(s) if requested
+            targets = dict(output_files or {})
             if output_file:
-                save_output(response, output_format, output_file)
+                targets[output_format] = output_file
+            if targets:
+                save_outputs(response, targets)
 
             return response
 
@@ -161,6 +177,7 @@ class MeetingTranscriber:
             audio_files: List[str],
             output_dir: Optional[str] = "outputs/transcription",
             output_format: str = "json",
+            max_workers: int = 1,
             **kwargs
     ) -> List[Dict[str, Any]]:
         """
@@ -170,17 +187,18 @@ class MeetingTranscriber:
             audio_files: List of paths to audio files
             output_dir: Directory to save output files
             output_format: Format for output files
+            max_workers: Number of files processed concurrently. Models are loaded once and
+                inference is serialized, so extra workers overlap audio decoding, resampling
+                and output writing of one file with inference on another.
             **kwargs: Additional arguments to pass to transcribe_audio
 
         Returns:
-            List of transcription results
+            List of transcription results (in the same order as audio_files)
         """
-        results = []
-
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
 
-        for audio_file in audio_files:
+        def transcribe_file(audio_file: str) -> Dict[str, Any]:
             file_name = os.path.basename(audio_file)
             logger.info(f"Processing file: {file_name}")
 
@@ -192,13 +210,15 @@ class MeetingTranscriber:
                 output_file = os.path.join(output_dir, f"{base_name}{extension}")
 
             # Transcribe the file
-            result = self.transcribe_audio(
+            return self.transcribe_audio(
                 audio_file,
                 output_format=output_format,
                 output_file=output_file,
                 **kwargs
             )
 
-            results.append(result)
+        if max_workers <= 1:
+            return [transcribe_file(audio_file) for audio_file in audio_files]
 
-        return results
\ No newline at end of file
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(transcribe_file, audio_files))
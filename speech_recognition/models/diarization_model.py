@@ -1,8 +1,9 @@
 import os
+import contextlib
 import tempfile
 from typing import List, Dict, Any, Optional
 
-from pyannote.audio import Pipeline
+import numpy as np
 import torch
 
 from speech_recognition.utils.audio_preprocessing import create_temp_wav_file
@@ -35,6 +36,9 @@ class SpeakerDiarizer:
             hf_token = os.environ.get("HF_ACCESS_TOKEN")
 
             if hf_token:
+                # Imported lazily: pyannote pulls in a large dependency tree that is only needed here
+                from pyannote.audio import Pipeline
+
                 self.diarizer = Pipeline.from_pretrained(self.model_name, use_auth_token=hf_token)
                 # Move to appropriate device if successfully loaded
                 if self.device == "cuda" and torch.cuda.is_available():
@@ -80,20 +84,20 @@ class SpeakerDiarizer:
                     return None
             finally:
                 # Clean up temporary file
-                if os.path.exists(temp_wav_path):
-                    try:
-                        os.unlink(temp_wav_path)
-                    except:
-                        pass
-
-            # Create a dictionary of speaker turns
-            speaker_turns = []
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_wav_path)
+
+            # Collect speaker turns as parallel arrays so overlaps can be computed in bulk
+            turn_speakers = []
+            turn_starts = []
+            turn_ends = []
             for turn, _, speaker in diarization.itertracks(yield_label=True):
-                speaker_turns.append({
-                    "speaker": f"Speaker_{speaker.replace('SPEAKER_', '')}",
-                    "start": turn.start,
-                    "end": turn.end
-                })
+                turn_speakers.append(f"Speaker_{speaker.replace('SPEAKER_', '')}")
+                turn_starts.append(turn.start)
+                turn_ends.append(turn.end)
+
+            turn_starts = np.asarray(turn_starts, dtype=np.float64)
+            turn_ends = np.asarray(turn_ends, dtype=np.float64)
 
             # Assign speakers to transcription segments
             speaker_segments = []
@@ -102,18 +106,12 @@ class SpeakerDiarizer:
                 segment_end = segment["end"]
 
                 # Find the speaker who speaks the most during this segment
-                best_overlap = 0
                 best_speaker = None
-
-                for turn in speaker_turns:
-                    # Calculate overlap
-                    overlap_start = max(segment_start, turn["start"])
-                    overlap_end = min(segment_end, turn["end"])
-                    overlap = max(0, overlap_end - overlap_start)
-
-                    if overlap > best_overlap:
-                        best_overlap = overlap
-                        best_speaker = turn["speaker"]
+                if turn_speakers:
+                    overlaps = np.minimum(turn_ends, segment_end) - np.maximum(turn_starts, segment_start)
+                    best_idx = int(np.argmax(overlaps))
+                    if overlaps[best_idx] > 0:
+                        best_speaker = turn_speakers[best_idx]
 
                 # If no clear speaker found, use "Unknown"
                 if not best_speaker:
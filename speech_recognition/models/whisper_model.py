@@ -1,8 +1,7 @@
 import torch
-import whisper
 from typing import Dict, Any, Optional
 
-from speech_recognition.core.config import WHISPER_MODELS
+from speech_recognition.core.config import WHISPER_MODELS, WHISPER_BACKENDS, DEFAULT_BACKEND
 from speech_recognition.utils.logging_setup import setup_logger
 
 logger = setup_logger("WhisperModel")
@@ -15,6 +14,7 @@ class WhisperTranscriber:
             model_name: str = "base",
             device: Optional[str] = None,
             language: str = "en",
+            backend: str = DEFAULT_BACKEND,
     ):
         # Auto-detect device if not specified
         if device is None:
@@ -28,11 +28,26 @@ class WhisperTranscriber:
             logger.warning(f"Invalid Whisper model: {model_name}. Using 'base' instead.")
             model_name = "base"
 
+        # Validate backend
+        if backend not in WHISPER_BACKENDS:
+            logger.warning(f"Invalid Whisper backend: {backend}. Using '{DEFAULT_BACKEND}' instead.")
+            backend = DEFAULT_BACKEND
+
         self.model_name = model_name
+        self.backend = backend
 
-        logger.info(f"Loading Whisper {model_name} model on {device}")
+        logger.info(f"Loading Whisper {model_name} model on {device} ({backend} backend)")
         try:
-            self.model = whisper.load_model(model_name, device=device)
+            if backend == "faster-whisper":
+                from faster_whisper import WhisperModel
+
+                # CTranslate2 int8 weights: int8 GEMMs on CPU, int8 weights with fp16 activations on GPU
+                compute_type = "int8_float16" if device == "cuda" else "int8"
+                self.model = WhisperModel(model_name, device=device, compute_type=compute_type)
+            else:
+                import whisper
+
+                self.model = whisper.load_model(model_name, device=device)
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}", exc_info=True)
             raise RuntimeError(f"Failed to initialize Whisper model: {e}")
@@ -46,5 +61,31 @@ class WhisperTranscriber:
         if "verbose" not in options:
             options["verbose"] = False
 
+        if self.backend == "faster-whisper":
+            return self._transcribe_faster_whisper(audio_array, **options)
+
         # Perform transcription
-        return self.model.transcribe(audio_array, **options)
\ No newline at end of file
+        return self.model.transcribe(audio_array, **options)
+
+    def _transcribe_faster_whisper(self, audio_array, **options) -> Dict[str, Any]:
+        segments, info = self.model.transcribe(
+            audio_array,
+            language=options["language"],
+            task=options["task"]
+        )
+
+        # Convert to the openai-whisper result layout used by the rest of the pipeline,
+        # collecting the full text in the same pass instead of walking the segments again
+        whisper_segments = []
+        text_parts = []
+        for i, segment in enumerate(segments):
+            whisper_segments.append(
+                {"id": i, "start": segment.start, "end": segment.end, "text": segment.text}
+            )
+            text_parts.append(segment.text)
+
+        return {
+            "text": "".join(text_parts),
+            "segments": whisper_segments,
+            "language": info.language
+        }
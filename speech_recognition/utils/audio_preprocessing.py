@@ -1,11 +1,11 @@
 import os
+import contextlib
 import tempfile
 import numpy as np
 import librosa
-from pydub import AudioSegment
 from typing import Optional, Tuple
 
-from speech_recognition.core.config import SUPPORTED_FORMATS
+from speech_recognition.core.config import SUPPORTED_FORMATS, NATIVE_DECODE_FORMATS
 from speech_recognition.utils.logging_setup import setup_logger
 
 logger = setup_logger("AudioProcessing")
@@ -20,24 +20,31 @@ def process_audio_file(audio_file_path: str) -> Tuple[Optional[np.ndarray], int,
         return None, None, None
 
     try:
-        # If wav format, load directly with librosa
-        if file_ext == ".wav":
+        # Formats libsndfile can decode are loaded directly with librosa, skipping the pydub re-encode
+        if file_ext in NATIVE_DECODE_FORMATS:
             # Whisper expects 16kHz mono audio
             audio_array, sampling_rate = librosa.load(audio_file_path, sr=16000, mono=True)
             duration = librosa.get_duration(y=audio_array, sr=sampling_rate)
             return audio_array, sampling_rate, duration
 
         # For other formats, convert to wav using pydub first
+        from pydub import AudioSegment
+
         logger.info(f"Converting {file_ext} to WAV format")
         with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+            temp_wav_path = temp_wav.name
+
+        try:
             audio = AudioSegment.from_file(audio_file_path)
             # Convert to mono and set sample rate to 16kHz for Whisper
             audio = audio.set_channels(1).set_frame_rate(16000)
-            audio.export(temp_wav.name, format="wav")
+            audio.export(temp_wav_path, format="wav")
 
             # Load the converted WAV file
-            audio_array, sampling_rate = librosa.load(temp_wav.name, sr=16000, mono=True)
+            audio_array, sampling_rate = librosa.load(temp_wav_path, sr=16000, mono=True)
             duration = len(audio) / 1000.0  # pydub duration is in milliseconds
+        finally:
+            os.unlink(temp_wav_path)
 
         return audio_array, sampling_rate, duration
 
@@ -70,7 +77,10 @@ def detect_audio_issues(audio_array: np.ndarray, sampling_rate: int) -> bool:
 
 
 def create_temp_wav_file(audio_file_path: str) -> str:
+    temp_wav_path = None
     try:
+        from pydub import AudioSegment
+
         temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
         temp_wav_path = temp_wav.name
         temp_wav.close()
@@ -85,9 +95,7 @@ def create_temp_wav_file(audio_file_path: str) -> str:
 
     except Exception as e:
         logger.error(f"Failed to create temporary WAV file: {str(e)}", exc_info=True)
-        if os.path.exists(temp_wav_path):
-            try:
+        if temp_wav_path:
+            with contextlib.suppress(OSError):
                 os.unlink(temp_wav_path)
-            except:
-                pass
         return None
\ No newline at end of file
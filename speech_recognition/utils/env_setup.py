@@ -1,11 +1,12 @@
 import os
 import logging
-from dotenv import load_dotenv
 
 
 def setup_environment():
     # Try to locate .env file in parent directory of the package
     try:
+        from dotenv import load_dotenv
+
         # Get the speech_recognition package directory
         package_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         env_file = os.path.join(package_dir, ".env")
@@ -2,47 +2,47 @@ import os
 import json
 from typing import Dict, List, Any
 
+from speech_recognition.core.config import OUTPUT_FORMATS
 from speech_recognition.utils.logging_setup import setup_logger
 
 logger = setup_logger("OutputFormatting")
 
 
 def save_output(result: Dict[str, Any], output_format: str, output_file: str) -> None:
-    try:
-        # Create directory if it doesn't exist
-        output_dir = os.path.dirname(output_file)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+    save_outputs(result, {output_format: output_file})
 
-        # Save based on format
-        if output_format.lower() == "json":
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
 
-        elif output_format.lower() == "txt":
+def save_outputs(result: Dict[str, Any], output_files: Dict[str, str]) -> None:
+    """Save a transcription result to several formats with one pass over the segments."""
+    try:
+        targets = {}
+        for output_format, output_file in output_files.items():
+            if output_format.lower() not in OUTPUT_FORMATS:
+                logger.warning(f"Unsupported output format: {output_format}")
+                continue
+            targets[output_format.lower()] = output_file
+
+            # Create directory if it doesn't exist
+            output_dir = os.path.dirname(output_file)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+        # Render every text-based format while walking the transcript once
+        renderers = {fmt: _SEGMENT_RENDERERS[fmt] for fmt in targets if fmt in _SEGMENT_RENDERERS}
+        contents = {fmt: [_FORMAT_HEADERS.get(fmt, "")] for fmt in renderers}
+        if renderers:
+            for i, segment in enumerate(result["transcript"], 1):
+                for fmt, render in renderers.items():
+                    contents[fmt].append(render(i, segment))
+
+        for output_format, output_file in targets.items():
             with open(output_file, 'w', encoding='utf-8') as f:
-                if any("speaker" in segment for segment in result["transcript"]):
-                    # Speaker-separated transcript with timestamps
-                    for segment in result["transcript"]:
-                        timestamp = format_timestamp(segment.get("start", 0), segment.get("end", 0))
-                        speaker = f"[{segment['speaker']}]: " if "speaker" in segment else ""
-                        f.write(f"{timestamp} {speaker}{segment['text']}\n")
+                if output_format == "json":
+                    json.dump(result, f, indent=2, ensure_ascii=False)
                 else:
-                    # Plain transcript with timestamps
-                    for segment in result["transcript"]:
-                        timestamp = format_timestamp(segment.get("start", 0), segment.get("end", 0))
-                        f.write(f"{timestamp} {segment['text']}\n")
-
-        elif output_format.lower() == "srt":
-            write_srt(result["transcript"], output_file)
-
-        elif output_format.lower() == "vtt":
-            write_vtt(result["transcript"], output_file)
+                    f.write("".join(contents[output_format]))
 
-        else:
-            logger.warning(f"Unsupported output format: {output_format}")
-
-        logger.info(f"Output saved to {output_file}")
+            logger.info(f"Output saved to {output_file}")
 
     except Exception as e:
         logger.error(f"Failed to save output: {str(e)}", exc_info=True)
@@ -75,76 +75,69 @@ def format_vtt_time(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds_int:02d}.{milliseconds:03d}"
 
 
-def write_srt(transcript: List[Dict[str, Any]], output_file: str) -> None:
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for i, segment in enumerate(transcript, 1):
-            # Add speaker label if available
-            text = segment["text"]
-            if "speaker" in segment:
-                text = f"[{segment['speaker']}] {text}"
+def _render_srt_segment(index: int, segment: Dict[str, Any]) -> str:
+    start_time = format_srt_time(segment.get("start", 0))
+    end_time = format_srt_time(segment.get("end", 0))
+    return f"{index}\n{start_time} --> {end_time}\n{_speaker_labeled_text(segment)}\n\n"
 
-            # Get timestamps (default to 0 if not available)
-            start_time = segment.get("start", 0)
-            end_time = segment.get("end", 0)
 
-            f.write(f"{i}\n")
-            f.write(f"{format_srt_time(start_time)} --> {format_srt_time(end_time)}\n")
-            f.write(f"{text}\n\n")
+def _render_vtt_segment(index: int, segment: Dict[str, Any]) -> str:
+    start_time = format_vtt_time(segment.get("start", 0))
+    end_time = format_vtt_time(segment.get("end", 0))
+    return f"{index}\n{start_time} --> {end_time}\n{_speaker_labeled_text(segment)}\n\n"
 
 
-def write_vtt(transcript: List[Dict[str, Any]], output_file: str) -> None:
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("WEBVTT\n\n")
+def _render_txt_segment(index: int, segment: Dict[str, Any]) -> str:
+    timestamp = format_timestamp(segment.get("start", 0), segment.get("end", 0))
+    speaker = f"[{segment['speaker']}]: " if "speaker" in segment else ""
+    return f"{timestamp} {speaker}{segment['text']}\n"
+
+
+def _speaker_labeled_text(segment: Dict[str, Any]) -> str:
+    # Add speaker label if available
+    if "speaker" in segment:
+        return f"[{segment['speaker']}] {segment['text']}"
+    return segment["text"]
 
-        for i, segment in enumerate(transcript, 1):
-            # Add speaker label if available
-            text = segment["text"]
-            if "speaker" in segment:
-                text = f"[{segment['speaker']}] {text}"
 
-            # Get timestamps (default to 0 if not available)
-            start_time = segment.get("start", 0)
-            end_time = segment.get("end", 0)
+# Per-segment renderers for the text-based formats, built once at import
+_SEGMENT_RENDERERS = {
+    "srt": _render_srt_segment,
+    "vtt": _render_vtt_segment,
+    "txt": _render_txt_segment,
+}
 
-            f.write(f"{i}\n")
-            f.write(f"{format_vtt_time(start_time)} --> {format_vtt_time(end_time)}\n")
-            f.write(f"{text}\n\n")
+_FORMAT_HEADERS = {
+    "vtt": "WEBVTT\n\n",
+}
+
+
+def write_srt(transcript: List[Dict[str, Any]], output_file: str) -> None:
+    save_outputs({"transcript": transcript}, {"srt": output_file})
+
+
+def write_vtt(transcript: List[Dict[str, Any]], output_file: str) -> None:
+    save_outputs({"transcript": transcript}, {"vtt": output_file})
 
 
 def format_transcript(
         result: Dict[str, Any],
         speaker_segments: List[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
-    formatted_transcript = []
-
-    # Process based on whether speaker segments are available
+    # Resolve the segment source and its fields once, then build the transcript in one pass
     if speaker_segments:
         # When speaker diarization is available, use speaker segments (which have timestamps)
-        for segment in speaker_segments:
-            formatted_transcript.append({
-                "text": segment["text"],
-                "speaker": segment["speaker"],
-                "start": segment["start"],
-                "end": segment["end"]
-            })
-    else:
+        segments = speaker_segments
+        fields = ("text", "speaker", "start", "end")
+    elif "segments" in result:
         # Without speaker diarization, use Whisper segments
-        if "segments" in result:
-            for segment in result["segments"]:
-                formatted_transcript.append({
-                    "text": segment["text"],
-                    "start": segment["start"],
-                    "end": segment["end"]
-                })
-        else:
-            # If no segments, use full text (no timestamps available)
-            formatted_transcript.append({
-                "text": result["text"],
-                "start": 0,
-                "end": 0
-            })
-
-    return formatted_transcript
+        segments = result["segments"]
+        fields = ("text", "start", "end")
+    else:
+        # If no segments, use full text (no timestamps available)
+        return [{"text": result["text"], "start": 0, "end": 0}]
+
+    return [{field: segment[field] for field in fields} for segment in segments]
 
 
 def create_error_response(error_message: str) -> Dict[str, Any]:
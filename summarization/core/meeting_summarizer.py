@@ -1,18 +1,24 @@
 import os
 import json
+import contextlib
 import logging
+import functools
+import hashlib
+import itertools
 from typing import Dict, List, Tuple, Any, Optional
 import torch
 from transformers import (
     BartForConditionalGeneration,
-    BartTokenizer,
-    pipeline
+    BartTokenizerFast
 )
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import (
+    ENGLISH_STOP_WORDS, HashingVectorizer, TfidfTransformer, TfidfVectorizer
+)
 import re
-from collections import Counter
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -21,43 +27,243 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# orjson serializes in C; fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Allow TF32 for any matmuls that still run in float32
+torch.set_float32_matmul_precision("high")
+
+# Inference backends for the BART model
+SUMMARIZER_BACKENDS = ["torch", "onnx"]
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "meeting_summarizer", "onnx")
+
+# More specific action indicators
+ACTION_PATTERNS = [
+    (r'\b(need to|needs to|needed to)\b', 'need'),
+    (r'\b(should|ought to)\b', 'should'),
+    (r'\b(will|\'ll)\b(?!.*\?)', 'will'),  # Exclude questions
+    (r'\b(going to|gonna)\b', 'going to'),
+    (r'\b(have to|has to|gotta)\b', 'must'),
+    (r'\b(must|required to)\b', 'must'),
+    (r'\b(let\'s|let us)\b', 'action'),
+    (r'\b(task|action item|todo|to-do)\b', 'task'),
+    (r'\b(follow[- ]up|follow up with)\b', 'follow-up'),
+    (r'\b(schedule|arrange|organize|plan)\b', 'planning'),
+    (r'\b(send|deliver|provide|share)\b', 'delivery'),
+    (r'\b(review|check|verify|confirm)\b', 'review'),
+    (r'\b(create|build|develop|implement)\b', 'development'),
+]
+
+# All indicators in one alternation so each utterance is scanned once
+ACTION_RE = re.compile("|".join(f"(?:{pattern})" for pattern, _ in ACTION_PATTERNS))
+
+# Filler openings that disqualify a segment from the extractive summary
+FILLER_PATTERNS = [
+    r'^(yeah|yep|yes|no|okay|ok|um|uh|like|so|well|right|sure|exactly)\b',
+    r'^\w{1,3}\b',  # Very short utterances
+    r'^[^\w\s]+$',  # Only punctuation
+]
+FILLER_RE = re.compile("|".join(f"(?:{pattern})" for pattern in FILLER_PATTERNS))
+
+# Filler vocabulary for summary cleanup and action item filtering
+FILLER_STARTERS = ('like', 'yeah', 'um', 'uh', 'so', 'well', 'i mean', 'you know')
+FILLER_WORDS = frozenset(['like', 'yeah', 'um', 'uh', 'just', 'really', 'kind', 'sort'])
+SUMMARY_FILLER_WORDS = FILLER_WORDS | {'thing'}
+
+# Text cleanup and splitting patterns
+EMPTY_QUOTES_RE = re.compile(r'"\s*"')
+WHITESPACE_RE = re.compile(r'\s+')
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+SPEAKER_LABEL_RE = re.compile(r'Speaker_\d+:')
+TOPIC_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+UNSAFE_PATH_CHARS_RE = re.compile(r'[^\w.-]')
+
+# Extended stop words for topic extraction, including common filler words
+TOPIC_STOP_WORDS = frozenset([
+    'like', 'yeah', 'think', 'know', 'just', 'kind', 'sort', 'um', 'uh',
+    'well', 'really', 'actually', 'basically', 'literally', 'okay', 'ok',
+    'right', 'sure', 'probably', 'maybe', 'guess', 'thing', 'things',
+    'stuff', 'lot', 'bit', 'little', 'going', 'gonna', 'want', 'need',
+    'mean', 'got', 'get', 'say', 'said', 'tell', 'told', 'come', 'came',
+    'make', 'made', 'way', 'time', 'good', 'bad', 'new', 'old', 'first',
+    'last', 'long', 'great', 'little', 'own', 'other', 'old', 'right',
+    'big', 'high', 'different', 'small', 'large', 'next', 'early', 'young',
+    'important', 'public', 'bad', 'same', 'able', 'don', 'did', 'let',
+    'level', 'look', 'looks', 'looked'
+])
+# Sorted array form (with the English list) for vectorized filtering of word counts
+TOPIC_STOP_WORD_ARRAY = np.array(sorted(TOPIC_STOP_WORDS | ENGLISH_STOP_WORDS))
+
+# Stateless n-gram hasher for extractive centrality, which only needs scores and no
+# vocabulary; wide enough that uni- to trigrams of a meeting rarely collide
+EXTRACTIVE_HASHER = HashingVectorizer(
+    stop_words='english',
+    ngram_range=(1, 3),
+    n_features=2 ** 18,
+    alternate_sign=False,
+    norm=None,
+    dtype=np.float32
+)
+
+# Inputs shorter than this (in words) are decoded greedily instead of with beam search
+GREEDY_DECODE_MAX_WORDS = 200
+
+# Instructional or unknown speakers left out of summaries and statistics
+EXCLUDED_SPEAKERS = frozenset(["Speaker_00", "Unknown"])
+
+# Number of transcripts whose non-abstractive analysis is kept per summarizer
+ANALYSIS_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tokenizer(model_path: str):
+    # Rust-backed BPE; the slow tokenizer dominates preprocessing on long transcripts
+    return BartTokenizerFast.from_pretrained(model_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(model_path: str, device: str, dtype: torch.dtype, quantize: bool = False,
+                compile_model: bool = False):
+    try:
+        model = BartForConditionalGeneration.from_pretrained(
+            model_path,
+            torch_dtype=dtype,
+            attn_implementation="sdpa"  # Fused scaled-dot-product attention kernels
+        )
+    except (TypeError, ValueError, ImportError) as e:
+        # Older transformers/torch builds without SDPA support for BART
+        logger.warning(f"SDPA attention unavailable ({e}), using eager attention")
+        model = BartForConditionalGeneration.from_pretrained(model_path, torch_dtype=dtype)
+    model = model.to(device)
+    model.eval()
+
+    if quantize and device == "cpu":
+        # Dynamic int8 quantization of the linear layers for faster CPU generation
+        logger.info("Applying dynamic int8 quantization to linear layers")
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if compile_model:
+        # Compile the forward pass generate() steps through; the first call pays the compile
+        # time. "reduce-overhead" adds CUDA graph capture for the small decode steps.
+        mode = "reduce-overhead" if device == "cuda" else "default"
+        if hasattr(torch, "compile"):
+            try:
+                logger.info("Compiling model forward pass with torch.compile")
+                model.forward = torch.compile(model.forward, mode=mode, fullgraph=False)
+            except Exception as e:
+                logger.warning(f"torch.compile failed ({e}), running the model eagerly")
+        else:
+            logger.warning("torch.compile requires PyTorch 2.0+, running the model eagerly")
+
+    return model
+
+
+@functools.lru_cache(maxsize=4)
+def _load_onnx_model(model_path: str, provider: str):
+    # ONNX Runtime fuses attention/LayerNorm/GELU kernels; generate() keeps the same API
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    # Export once and reuse the exported graph on later runs
+    export_dir = os.path.join(ONNX_CACHE_DIR, UNSAFE_PATH_CHARS_RE.sub('_', model_path))
+    if os.path.isdir(export_dir):
+        logger.info(f"Loading cached ONNX export from {export_dir}")
+        return ORTModelForSeq2SeqLM.from_pretrained(export_dir, provider=provider)
+
+    logger.info("Exporting model to ONNX (first run only)")
+    model = ORTModelForSeq2SeqLM.from_pretrained(model_path, export=True, provider=provider)
+    model.save_pretrained(export_dir)
+    return model
+
 
 class MeetingSummarizer:
 
-    def __init__(self, model_path: str = "facebook/bart-large-cnn"):
-        logger.info(f"Initializing MeetingSummarizer with model: {model_path}")
+    def __init__(self, model_path: str = "facebook/bart-large-cnn", backend: str = "torch",
+                 max_batch_chunks: int = 8, parallel_streams: int = 1, quantize_cpu: bool = True,
+                 compile_model: bool = False, num_threads: Optional[int] = None):
+        logger.info(f"Initializing MeetingSummarizer with model: {model_path} ({backend} backend)")
+
+        if backend not in SUMMARIZER_BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}. Choose from {SUMMARIZER_BACKENDS}")
+        self.backend = backend
+
+        # Chunks per generate() call, and how many of those groups may run at once on
+        # separate CUDA streams (more streams trade VRAM for latency on long meetings)
+        self.max_batch_chunks = max(1, max_batch_chunks)
+        self.parallel_streams = max(1, parallel_streams)
+
+        # Extractive/topic/action-item results by transcript hash, so regenerating the
+        # abstractive summary with other length settings skips everything else
+        self._analysis_cache = OrderedDict()
 
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"Using device: {self.device}")
 
-        # Load tokenizer and model
-        self.tokenizer = BartTokenizer.from_pretrained(model_path)
-        self.model = BartForConditionalGeneration.from_pretrained(model_path).to(self.device)
-
-        # Initialize summarization pipeline for abstractive summaries
-        self.summarization_pipeline = pipeline(
-            "summarization",
-            model=model_path,
-            tokenizer=self.tokenizer,
-            device=0 if self.device == "cuda" else -1
-        )
+        # The int8 CPU kernels scale with intra-op threads; use every core unless told otherwise
+        if self.device == "cpu":
+            torch.set_num_threads(num_threads or os.cpu_count() or 1)
+            logger.info(f"Using {torch.get_num_threads()} CPU threads")
+
+        # Half precision on GPU runs generation on Tensor Cores (BF16 where supported)
+        self.dtype = torch.float32
+        if self.device == "cuda":
+            self.dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+        # Tokenizer and model are loaded on first abstractive use (see the properties
+        # below), so callers that only need the extractive analysis never pay for them
+        self.model_path = model_path
+        self.quantize_cpu = quantize_cpu
+        self.compile_model = compile_model
+        self._tokenizer = None
+        self._model = None
+        self._load_lock = threading.Lock()
 
         logger.info("MeetingSummarizer initialized successfully")
 
+    @property
+    def tokenizer(self):
+        """Tokenizer, loaded on first access (shared across instances)."""
+        if self._tokenizer is None:
+            with self._load_lock:
+                if self._tokenizer is None:
+                    self._tokenizer = _load_tokenizer(self.model_path)
+        return self._tokenizer
+
+    @property
+    def model(self):
+        """Summarization model, loaded on first access (shared across instances)."""
+        if self._model is None:
+            # Generation groups may run on several threads; only one of them loads
+            with self._load_lock:
+                if self._model is None:
+                    logger.info(f"Loading summarization model: {self.model_path}")
+                    if self.backend == "onnx":
+                        provider = "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+                        self._model = _load_onnx_model(self.model_path, provider)
+                    else:
+                        self._model = _load_model(
+                            self.model_path, self.device, self.dtype,
+                            quantize=self.quantize_cpu,
+                            compile_model=self.compile_model
+                        )
+        return self._model
+
     def _clean_summary_text(self, text: str) -> str:
         if not text:
             return text
             
         # Remove excessive quotes and fix formatting
-        text = re.sub(r'"\s*"', '', text)  # Remove empty quotes
-        text = re.sub(r'\s+', ' ', text)   # Normalize whitespace
+        text = EMPTY_QUOTES_RE.sub('', text)  # Remove empty quotes
+        text = WHITESPACE_RE.sub(' ', text)   # Normalize whitespace
         
         # Remove sentences that are just filler or too short
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_SPLIT_RE.split(text)
         cleaned_sentences = []
         
-        filler_starters = ['like', 'yeah', 'um', 'uh', 'so', 'well', 'i mean', 'you know']
-        
         for sentence in sentences:
             sentence = sentence.strip()
             
@@ -66,12 +272,13 @@ class MeetingSummarizer:
                 continue
                 
             # Skip if starts with filler
-            if any(sentence.lower().startswith(filler) for filler in filler_starters):
+            sentence_lower = sentence.lower()
+            if sentence_lower.startswith(FILLER_STARTERS):
                 continue
             
             # Skip if mostly filler words
-            words = sentence.lower().split()
-            filler_count = sum(1 for word in words if word in ['like', 'yeah', 'um', 'uh', 'just', 'really', 'kind', 'sort', 'thing'])
+            words = sentence_lower.split()
+            filler_count = sum(1 for word in words if word in SUMMARY_FILLER_WORDS)
             if len(words) > 0 and filler_count / len(words) > 0.3:
                 continue
                 
@@ -84,112 +291,176 @@ class MeetingSummarizer:
             
         return result
 
-    def _preprocess_transcript(self, transcript_data: Dict[str, Any]) -> Tuple[str, Dict[str, List[Dict[str, Any]]]]:
+    def _preprocess_transcript(
+            self, transcript_segments: List[Dict[str, Any]], full_text: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Dict[str, Any]]]:
         logger.info("Preprocessing transcript data")
 
-        # Extract the transcript segments
-        transcript_segments = transcript_data.get("transcript", [])
+        # Single pass over the segments: collect every text for the full transcript
+        # (unless it was supplied), keep content segments and collect their fields
+        # as parallel columns so later passes never re-read the dicts
+        all_texts = [] if not full_text else None
+        content_segments = []
+        texts = []
+        lower_texts = []
+        word_counts = []
+        speakers = []
+        durations = []
+        for segment in transcript_segments:
+            text = segment.get("text", "")
+            if all_texts is not None:
+                all_texts.append(text)
 
-        # Get the full text
-        full_text = transcript_data.get("full_text", "")
-        if not full_text and transcript_segments:
-            full_text = " ".join([segment.get("text", "") for segment in transcript_segments])
+            speaker = segment.get("speaker")
+            if speaker in EXCLUDED_SPEAKERS:
+                continue
 
-        # Group utterances by speaker
-        speakers_utterances = {}
-        for segment in transcript_segments:
-            speaker = segment.get("speaker", "Unknown")
-            if speaker not in speakers_utterances:
-                speakers_utterances[speaker] = []
+            content_segments.append(segment)
+            texts.append(text)
+            lower_texts.append(text.strip().lower())
+            word_counts.append(len(text.split()))
+            speakers.append(speaker)
+            durations.append(segment.get("end", 0) - segment.get("start", 0))
+
+        if all_texts is not None:
+            full_text = " ".join(all_texts)
+
+        content = {
+            "segments": content_segments,
+            "text": texts,
+            "lower": lower_texts,
+            "word_count": np.asarray(word_counts, dtype=np.int32),
+            "action": np.fromiter((ACTION_RE.search(text) is not None for text in lower_texts),
+                                  dtype=bool, count=len(lower_texts)),
+            "filler": np.fromiter((FILLER_RE.match(text) is not None for text in lower_texts),
+                                  dtype=bool, count=len(lower_texts))
+        }
 
-            speakers_utterances[speaker].append({
-                "text": segment.get("text", ""),
-                "start": segment.get("start", 0),
-                "end": segment.get("end", 0)
-            })
+        # Unlabeled segments count as content but are not attributed to a speaker
+        labeled = [i for i, speaker in enumerate(speakers) if speaker is not None]
+        speaker_stats = self._compute_speaker_stats(
+            [speakers[i] for i in labeled],
+            [durations[i] for i in labeled],
+            content["word_count"][labeled]
+        )
 
-        return full_text, speakers_utterances
+        return full_text, content, speaker_stats
 
-    def _generate_extractive_summary(self, transcript_segments: List[Dict[str, Any]], n_sentences: int = 5) -> List[Dict[str, Any]]:
-        logger.info(f"Generating extractive summary with {n_sentences} sentences")
+    def _compute_speaker_stats(self, speakers: List[str], durations: List[float],
+                               word_counts: List[int]) -> Dict[str, Dict[str, Any]]:
+        if not speakers:
+            return {}
 
-        # Filter out segments from the instruction speaker (typically Speaker_00)
-        content_segments = [seg for seg in transcript_segments
-                            if seg.get("speaker") not in ["Speaker_00", "Unknown"]]
+        # Factorize speakers in order of first appearance (a dict lookup per utterance,
+        # no string sort), then reduce each column with bincount
+        speaker_index = {}
+        speaker_ids = np.fromiter(
+            (speaker_index.setdefault(speaker, len(speaker_index)) for speaker in speakers),
+            dtype=np.intp,
+            count=len(speakers)
+        )
+        speaking_times = np.bincount(speaker_ids, weights=np.asarray(durations, dtype=np.float64))
+        utterances = np.bincount(speaker_ids)
+        total_words = np.bincount(speaker_ids, weights=np.asarray(word_counts, dtype=np.float64)).astype(np.int64)
 
+        speaker_stats = {}
+        for speaker, time, num_utterances, words in zip(
+                speaker_index, speaking_times.tolist(), utterances.tolist(), total_words.tolist()):
+            speaker_stats[speaker] = {
+                "speaking_time": time,
+                "utterances": num_utterances,
+                "avg_words_per_utterance": words / num_utterances,
+                "total_words": words
+            }
+
+        return speaker_stats
+
+    def _build_tfidf(self, sentences: List[str], **vectorizer_params) -> Tuple[TfidfVectorizer, Any]:
+        # Fit a vectorizer once and hand back both it and its matrix;
+        # float32 halves the sparse matrix size for the scoring products
+        vectorizer_params.setdefault("dtype", np.float32)
+        vectorizer = TfidfVectorizer(**vectorizer_params)
+        tfidf_matrix = vectorizer.fit_transform(sentences)
+        return vectorizer, tfidf_matrix
+
+    def _iter_top_indices(self, scores: np.ndarray, k: int):
+        # Yield indices by descending score, ties by descending index (the order of a
+        # stable argsort reversed). The top k are selected with a partial sort, and the
+        # remainder is only sorted if the caller keeps consuming past them.
+        k = min(k, len(scores))
+        if k == 0:
+            return
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)
+        top = np.concatenate((above, tied[::-1][:k - len(above)]))
+        yield from top[np.lexsort((-top, -scores[top]))]
+        
+        remaining = np.ones(len(scores), dtype=bool)
+        remaining[top] = False
+        rest = np.flatnonzero(remaining)
+        yield from rest[np.lexsort((-rest, -scores[rest]))]
+
+    def _generate_extractive_summary(self, content: Dict[str, Any], n_sentences: int = 5) -> List[Dict[str, Any]]:
+        logger.info(f"Generating extractive summary with {n_sentences} sentences")
+
+        # Segments from the instruction speaker (typically Speaker_00) are already filtered out
+        content_segments = content["segments"]
         if not content_segments:
             logger.warning("No content segments found for extractive summary")
             return []
 
         # Extract text from segments
-        sentences = [seg.get("text", "") for seg in content_segments]
+        sentences = content["text"]
+        word_counts = content["word_count"]
 
         if len(sentences) <= n_sentences:
             logger.info(f"Few segments ({len(sentences)}), returning all")
             return content_segments
 
         # Filter out very short sentences and filler phrases
-        filtered_segments = []
-        filler_patterns = [
-            r'^(yeah|yep|yes|no|okay|ok|um|uh|like|so|well|right|sure|exactly)\b',
-            r'^\w{1,3}\b',  # Very short utterances
-            r'^[^\w\s]+$',  # Only punctuation
-        ]
+        filtered_indices = np.flatnonzero((word_counts >= 5) & ~content["filler"])
         
-        for i, seg in enumerate(content_segments):
-            text = seg.get("text", "").strip().lower()
-            
-            # Skip if too short
-            if len(text.split()) < 5:
-                continue
-                
-            # Skip if matches filler patterns
-            is_filler = any(re.match(pattern, text) for pattern in filler_patterns)
-            if is_filler:
-                continue
-                
-            filtered_segments.append((i, seg, sentences[i]))
-        
-        if not filtered_segments:
+        if not filtered_indices.size:
             logger.warning("All segments filtered out, using original segments")
-            filtered_segments = [(i, seg, sentences[i]) for i, seg in enumerate(content_segments)]
+            filtered_indices = np.arange(len(content_segments))
         
         # Extract just the text for TF-IDF
-        filtered_sentences = [item[2] for item in filtered_segments]
+        filtered_sentences = [sentences[i] for i in filtered_indices]
 
         # Use TF-IDF and cosine similarity to find important sentences
-        vectorizer = TfidfVectorizer(
-            stop_words='english',
-            max_df=0.85,
-            min_df=1,
-            ngram_range=(1, 3),
-            max_features=1000
-        )
         try:
-            # Create TF-IDF matrix
-            tfidf_matrix = vectorizer.fit_transform(filtered_sentences)
-
-            # Calculate similarity between sentences
-            similarity_matrix = cosine_similarity(tfidf_matrix)
-
-            # Calculate sentence scores based on centrality
-            scores = np.sum(similarity_matrix, axis=1)
+            # Create TF-IDF matrix from hashed n-gram counts (no vocabulary pass);
+            # unit rows, so dot products are already cosine similarities
+            term_counts = EXTRACTIVE_HASHER.transform(filtered_sentences)
+            tfidf_matrix = TfidfTransformer(norm='l2').fit_transform(term_counts)
+
+            # Calculate sentence scores based on centrality: the row sums of the cosine
+            # similarity matrix, computed as one product with the summed unit vectors
+            # instead of building the dense N x N matrix
+            scores = np.asarray(tfidf_matrix @ tfidf_matrix.sum(axis=0).T).ravel()
             
             # Also consider sentence length (prefer medium-length sentences)
-            length_scores = np.array([min(len(s.split()), 30) / 30.0 for s in filtered_sentences])
+            length_scores = np.minimum(word_counts[filtered_indices], 30) / 30.0
             
             # Combine scores
             combined_scores = scores * 0.7 + length_scores * 0.3
 
             # Get indices of top sentences
-            n_to_extract = min(n_sentences, len(filtered_segments))
-            top_indices = np.argsort(combined_scores)[-n_to_extract:]
+            n_to_extract = min(n_sentences, len(filtered_indices))
+            # (partial selection: their order does not matter here, but which of several
+            # tied scores make the cut does, so ties follow _iter_top_indices' rule)
+            top_indices = np.fromiter(
+                itertools.islice(self._iter_top_indices(combined_scores, n_to_extract), n_to_extract),
+                dtype=np.intp,
+                count=n_to_extract
+            )
 
             # Sort indices by their position in the original text
-            top_indices = sorted(top_indices)
+            top_indices = np.sort(top_indices)
 
             # Return the top segments with their metadata
-            important_segments = [filtered_segments[i][1] for i in top_indices]
+            important_segments = [content_segments[filtered_indices[i]] for i in top_indices]
             return important_segments
 
         except Exception as e:
@@ -205,23 +476,97 @@ class MeetingSummarizer:
             return text
 
         try:
-            summary = self.summarization_pipeline(
-                text,
+            # Generate directly with the loaded model; the summary comes back cleaned.
+            # Beam search buys little on short inputs, so those are decoded greedily.
+            num_beams = 1 if len(text.split()) < GREEDY_DECODE_MAX_WORDS else 4
+            return self._generate_batch_summaries([text], max_length, min_length, num_beams=num_beams)[0]
+
+        except Exception as e:
+            logger.error(f"Error in abstractive summarization: {e}")
+            return f"Failed to generate abstractive summary: {str(e)}"
+
+    def _generate_batch_summaries(self, texts: List[str], max_length: int, min_length: int,
+                                  num_beams: int = 4) -> List[str]:
+        # Texts too short to summarize are passed through unchanged, as in _generate_abstractive_summary
+        summaries = list(texts)
+        batch_indices = [i for i, text in enumerate(texts) if len(text.split()) >= 30]
+        if not batch_indices:
+            return summaries
+
+        encoded = self.tokenizer(
+            [texts[i] for i in batch_indices],
+            truncation=True,
+            max_length=1024
+        )["input_ids"]
+
+        generated = self._generate_from_token_ids(encoded, max_length, min_length, num_beams=num_beams)
+        for i, summary_text in zip(batch_indices, generated):
+            summaries[i] = summary_text
+
+        return summaries
+
+    def _generate_from_token_ids(self, chunk_ids: List[List[int]], max_length: int, min_length: int,
+                                 num_beams: int = 4) -> List[str]:
+        if not chunk_ids:
+            return []
+
+        # Split into groups that fit in memory; with several CUDA streams the groups
+        # are generated concurrently instead of one after another
+        groups = [chunk_ids[i:i + self.max_batch_chunks]
+                  for i in range(0, len(chunk_ids), self.max_batch_chunks)]
+        num_workers = min(self.parallel_streams, len(groups))
+
+        if num_workers <= 1 or self.device != "cuda" or self.backend != "torch":
+            return [summary for group in groups
+                    for summary in self._generate_group(group, max_length, min_length, num_beams)]
+
+        logger.info(f"Generating {len(groups)} chunk groups on {num_workers} CUDA streams")
+
+        def generate_on_stream(group: List[List[int]]) -> List[str]:
+            stream = torch.cuda.Stream()
+            with torch.cuda.stream(stream):
+                summaries = self._generate_group(group, max_length, min_length, num_beams)
+            stream.synchronize()
+            return summaries
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return [summary for group_summaries in executor.map(generate_on_stream, groups)
+                    for summary in group_summaries]
+
+    def _autocast(self):
+        # Under autocast, precision-sensitive ops (softmax, layer norm) run in float32
+        # even though the half-precision weights drive the matmuls
+        if self.device == "cuda" and self.backend == "torch":
+            return torch.autocast("cuda", dtype=self.dtype)
+        return contextlib.nullcontext()
+
+    def _generate_group(self, chunk_ids: List[List[int]], max_length: int, min_length: int,
+                        num_beams: int = 4) -> List[str]:
+        # Pad all chunks into one batch and run a single generate() call
+        inputs = self.tokenizer.pad(
+            {"input_ids": chunk_ids},
+            padding=True,
+            pad_to_multiple_of=8,  # Keeps padded shapes Tensor Core friendly
+            return_tensors="pt"
+        ).to(self.device)
+
+        with torch.inference_mode(), self._autocast():
+            output_ids = self.model.generate(
+                **inputs,
                 max_length=max_length,
                 min_length=min_length,
-                do_sample=False
+                num_beams=num_beams,
+                do_sample=False,
+                early_stopping=num_beams > 1,
+                use_cache=True
             )
 
-            summary_text = summary[0]['summary_text']
-            
-            # Clean the summary
+        summaries = []
+        for summary_text in self.tokenizer.batch_decode(output_ids, skip_special_tokens=True):
             cleaned_summary = self._clean_summary_text(summary_text)
-            
-            return cleaned_summary if cleaned_summary else summary_text
+            summaries.append(cleaned_summary if cleaned_summary else summary_text)
 
-        except Exception as e:
-            logger.error(f"Error in abstractive summarization: {e}")
-            return f"Failed to generate abstractive summary: {str(e)}"
+        return summaries
 
     def _generate_abstractive_summary_for_long_text(self, text: str, max_length: int = 150,
                                                     min_length: int = 30) -> str:
@@ -236,10 +581,11 @@ class MeetingSummarizer:
         chunk_overlap = 100  # Number of tokens to overlap between chunks
 
         try:
-            # Tokenize the full text
-            tokens = self.tokenizer(text, return_tensors="pt", truncation=False)
-            input_ids = tokens["input_ids"][0]
+            # Tokenize the full text once; chunks are sliced from these ids and
+            # framed with BOS/EOS themselves, so they never go back through text
+            input_ids = self.tokenizer(text, add_special_tokens=False, truncation=False)["input_ids"]
             full_length = len(input_ids)
+            bos_id, eos_id = self.tokenizer.bos_token_id, self.tokenizer.eos_token_id
 
             logger.info(f"Processing long input ({full_length} tokens) with chunking approach")
 
@@ -247,31 +593,47 @@ class MeetingSummarizer:
             effective_chunk_size = max_chunk_tokens - chunk_overlap
             num_chunks = (full_length + effective_chunk_size - 1) // effective_chunk_size
 
-            # Initialize intermediate summaries list
-            intermediate_summaries = []
-
-            # Process each chunk
+            # Slice all chunks up front so they can be summarized in one batch
+            chunk_ids = []
+            tail_text = None
             for i in range(num_chunks):
                 start_idx = i * effective_chunk_size
                 end_idx = min(start_idx + max_chunk_tokens, full_length)
 
-                # Get chunk text
+                # Get chunk tokens
                 chunk_tokens = input_ids[start_idx:end_idx]
-                chunk_text = self.tokenizer.decode(chunk_tokens, skip_special_tokens=True)
 
-                logger.info(f"Processing chunk {i + 1}/{num_chunks} ({len(chunk_tokens)} tokens)")
+                # Only a short trailing chunk can be too small to summarize; keep it as text
+                if len(chunk_tokens) < max_chunk_tokens:
+                    chunk_text = self.tokenizer.decode(chunk_tokens, skip_special_tokens=True)
+                    if len(chunk_text.split()) < 30:
+                        tail_text = chunk_text
+                        continue
 
-                # Generate summary for this chunk
-                chunk_summary = self._generate_abstractive_summary(
-                    chunk_text,
-                    max_length=max(30, max_length // 2),  # Shorter intermediate summaries
-                    min_length=min(15, min_length // 2)
-                )
+                chunk_ids.append([bos_id] + chunk_tokens + [eos_id])
+
+            logger.info(f"Summarizing {len(chunk_ids)} chunks in a single batch")
 
-                intermediate_summaries.append(chunk_summary)
+            # Generate summaries for all chunks at once
+            intermediate_summaries = self._generate_from_token_ids(
+                chunk_ids,
+                max_length=max(30, max_length // 2),  # Shorter intermediate summaries
+                min_length=min(15, min_length // 2),
+                num_beams=1  # Greedy: intermediate summaries are condensed again in the final pass
+            )
+            if tail_text:
+                intermediate_summaries.append(tail_text)
 
-            # Combine intermediate summaries
-            combined_text = " ".join(intermediate_summaries)
+            # Combine intermediate summaries, dropping sentences restated across overlapping chunks
+            combined_text = self._deduplicate_summary_sentences(intermediate_summaries)
+
+            # A couple of intermediate summaries that already fit the target length
+            # do not need another full BART pass
+            if len(intermediate_summaries) <= 2:
+                combined_length = len(self.tokenizer(combined_text, add_special_tokens=False)["input_ids"])
+                if combined_length <= max_length * 1.5:
+                    logger.info("Intermediate summaries already fit the target length, skipping final pass")
+                    return self._clean_summary_text(combined_text) or combined_text
 
             # Final summarization pass
             logger.info(f"Generating final summary from {len(intermediate_summaries)} intermediate summaries")
@@ -288,74 +650,59 @@ class MeetingSummarizer:
             logger.warning("Falling back to extractive summarization due to error")
             return "Failed to generate abstractive summary. Please check the extractive summary instead."
 
+    def _deduplicate_summary_sentences(self, summaries: List[str], threshold: float = 0.75) -> str:
+        kept_sentences = []
+        kept_token_sets = []
+
+        for summary in summaries:
+            for sentence in SENTENCE_BOUNDARY_RE.split(summary.strip()):
+                tokens = set(sentence.lower().split())
+                if not tokens:
+                    continue
+
+                # Skip sentences whose token-set Jaccard similarity to a kept one exceeds the threshold
+                if any(len(tokens & kept) / len(tokens | kept) > threshold for kept in kept_token_sets):
+                    continue
+
+                kept_token_sets.append(tokens)
+                kept_sentences.append(sentence)
+
+        return " ".join(kept_sentences)
+
     def _identify_key_topics(self, text: str, num_topics: int = 5) -> List[str]:
         logger.info(f"Identifying {num_topics} key topics")
 
         try:
-            # Extended stop words list including common filler words
-            custom_stop_words = set([
-                'like', 'yeah', 'think', 'know', 'just', 'kind', 'sort', 'um', 'uh',
-                'well', 'really', 'actually', 'basically', 'literally', 'okay', 'ok',
-                'right', 'sure', 'probably', 'maybe', 'guess', 'thing', 'things',
-                'stuff', 'lot', 'bit', 'little', 'going', 'gonna', 'want', 'need',
-                'mean', 'got', 'get', 'say', 'said', 'tell', 'told', 'come', 'came',
-                'make', 'made', 'way', 'time', 'good', 'bad', 'new', 'old', 'first',
-                'last', 'long', 'great', 'little', 'own', 'other', 'old', 'right',
-                'big', 'high', 'different', 'small', 'large', 'next', 'early', 'young',
-                'important', 'public', 'bad', 'same', 'able', 'don', 'did', 'let',
-                'level', 'look', 'looks', 'looked'
-            ])
-            
             # Clean the text first
             # Remove speaker labels
-            text_cleaned = re.sub(r'Speaker_\d+:', '', text)
-            
-            # Split into words and filter
-            words = re.findall(r'\b[a-zA-Z]{4,}\b', text_cleaned.lower())
-            
-            # Count word frequencies
-            word_freq = Counter(words)
-            
-            # Remove stop words and custom stop words
-            from sklearn.feature_extraction import _stop_words
-            english_stops = _stop_words.ENGLISH_STOP_WORDS
-            
-            # Filter and get significant words
-            significant_words = {}
-            for word, count in word_freq.items():
-                if (word not in custom_stop_words and 
-                    word not in english_stops and
-                    count >= 3 and  # Must appear at least 3 times
-                    len(word) >= 4):  # At least 4 characters
-                    significant_words[word] = count
+            text_cleaned = SPEAKER_LABEL_RE.sub('', text)
             
             # Try extracting multi-word phrases (bigrams and trigrams)
-            sentences = [s.strip() for s in re.split(r'[.!?]+', text_cleaned) if len(s.strip()) > 20]
+            sentences = [s for s in map(str.strip, SENTENCE_SPLIT_RE.split(text_cleaned)) if len(s) > 20]
             
             if len(sentences) >= 3:
-                # Use TF-IDF for phrase extraction
-                vectorizer = TfidfVectorizer(
-                    max_df=0.6,
-                    min_df=2,
-                    stop_words='english',
-                    max_features=100,
-                    ngram_range=(2, 4),  # Bigrams to 4-grams
-                    token_pattern=r'\b[a-zA-Z]{3,}\b'
-                )
-                
                 try:
-                    tfidf_matrix = vectorizer.fit_transform(sentences)
+                    # Use TF-IDF for phrase extraction
+                    vectorizer, tfidf_matrix = self._build_tfidf(
+                        sentences,
+                        max_df=0.6,
+                        min_df=2,
+                        stop_words='english',
+                        max_features=100,
+                        ngram_range=(2, 4),  # Bigrams to 4-grams
+                        token_pattern=r'\b[a-zA-Z]{3,}\b'
+                    )
                     feature_names = vectorizer.get_feature_names_out()
                     scores = np.asarray(tfidf_matrix.sum(axis=0)).flatten()
                     
                     # Get top phrases
                     phrase_candidates = []
-                    for idx in scores.argsort()[::-1]:
+                    for idx in self._iter_top_indices(scores, num_topics * 4):
                         phrase = feature_names[idx]
                         
                         # Filter out phrases with stop words
                         phrase_words = phrase.split()
-                        if any(word in custom_stop_words for word in phrase_words):
+                        if any(word in TOPIC_STOP_WORDS for word in phrase_words):
                             continue
                         
                         # Check if phrase is meaningful
@@ -377,9 +724,18 @@ class MeetingSummarizer:
                 except Exception as e:
                     logger.warning(f"Phrase extraction failed: {e}, falling back to single words")
             
-            # Fallback: use single significant words
-            sorted_words = sorted(significant_words.items(), key=lambda x: x[1], reverse=True)
-            topics = [word.capitalize() for word, count in sorted_words[:num_topics]]
+            # Fallback: use single significant words. Count them in one vectorized pass
+            # (TOPIC_WORD_RE already enforces at least 4 characters)
+            words = np.array(TOPIC_WORD_RE.findall(text_cleaned.lower()), dtype=np.str_)
+            unique_words, first_seen, counts = np.unique(words, return_index=True, return_counts=True)
+            
+            # Must appear at least 3 times and not be a stop word
+            keep = (counts >= 3) & ~np.isin(unique_words, TOPIC_STOP_WORD_ARRAY)
+            unique_words, first_seen, counts = unique_words[keep], first_seen[keep], counts[keep]
+            
+            # Most frequent first; ties keep the order of first appearance
+            order = np.lexsort((first_seen, -counts))[:num_topics]
+            topics = [str(unique_words[i]).capitalize() for i in order]
             
             return topics if topics else ["No specific topics identified"]
 
@@ -387,146 +743,141 @@ class MeetingSummarizer:
             logger.error(f"Error identifying topics: {e}")
             return ["Error identifying topics"]
 
-    def _extract_action_items(self, transcript_segments: List[Dict[str, Any]]) -> List[str]:
+    def _extract_action_items(self, content: Dict[str, Any]) -> List[str]:
         logger.info("Extracting action items")
 
         action_items = []
-        
-        # More specific action indicators
-        action_patterns = [
-            (r'\b(need to|needs to|needed to)\b', 'need'),
-            (r'\b(should|ought to)\b', 'should'),
-            (r'\b(will|\'ll)\b(?!.*\?)', 'will'),  # Exclude questions
-            (r'\b(going to|gonna)\b', 'going to'),
-            (r'\b(have to|has to|gotta)\b', 'must'),
-            (r'\b(must|required to)\b', 'must'),
-            (r'\b(let\'s|let us)\b', 'action'),
-            (r'\b(task|action item|todo|to-do)\b', 'task'),
-            (r'\b(follow[- ]up|follow up with)\b', 'follow-up'),
-            (r'\b(schedule|arrange|organize|plan)\b', 'planning'),
-            (r'\b(send|deliver|provide|share)\b', 'delivery'),
-            (r'\b(review|check|verify|confirm)\b', 'review'),
-            (r'\b(create|build|develop|implement)\b', 'development'),
-        ]
-
-        for segment in transcript_segments:
-            text = segment.get("text", "").strip()
-            text_lower = text.lower()
-            speaker = segment.get("speaker", "")
-
-            # Skip instructional or unknown speakers
-            if speaker in ["Speaker_00", "Unknown"]:
-                continue
-                
-            # Skip very short utterances
-            if len(text.split()) < 5:
-                continue
+        seen = set()
 
-            # Check if the segment contains action indicators
-            matched = False
-            for pattern, category in action_patterns:
-                if re.search(pattern, text_lower):
-                    matched = True
-                    break
-            
-            if not matched:
-                continue
+        # Instructional speakers are already filtered out and action indicators
+        # were matched during preprocessing; keep segments with an action indicator
+        # that are not very short utterances
+        word_counts = content["word_count"]
+        for i in np.flatnonzero(content["action"] & (word_counts >= 5)):
+            text = content["text"][i].strip()
+            text_lower = content["lower"][i]
+            speaker = content["segments"][i].get("speaker", "")
             
             # Additional filtering: skip questions and vague statements
             if text.strip().endswith('?'):
                 continue
                 
             # Skip if it's too vague or just contains filler
-            filler_ratio = sum(1 for word in text_lower.split() 
-                             if word in ['like', 'yeah', 'um', 'uh', 'just', 'really', 'kind', 'sort'])
-            if filler_ratio > len(text.split()) * 0.3:  # More than 30% filler words
+            filler_ratio = sum(1 for word in text_lower.split() if word in FILLER_WORDS)
+            if filler_ratio > word_counts[i] * 0.3:  # More than 30% filler words
                 continue
             
             # Clean up the text
-            cleaned_text = re.sub(r'\s+', ' ', text).strip()
+            cleaned_text = WHITESPACE_RE.sub(' ', text).strip()
             
             # Limit length for readability
             if len(cleaned_text.split()) > 40:
                 cleaned_text = ' '.join(cleaned_text.split()[:40]) + '...'
             
+            # Skip duplicates (compared without the speaker) while preserving order
+            key = cleaned_text.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+
             # Add speaker information
             action_items.append(f"{speaker}: {cleaned_text}")
+            if len(action_items) >= 15:  # Limit to top 15 action items
+                break
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_action_items = []
-        for item in action_items:
-            # Create a simplified version for duplicate checking
-            simplified = re.sub(r'Speaker_\d+:', '', item).strip().lower()
-            if simplified not in seen:
-                seen.add(simplified)
-                unique_action_items.append(item)
+        return action_items
 
-        return unique_action_items[:15]  # Limit to top 15 action items
+    def _transcript_key(self, transcript_segments: List[Dict[str, Any]], full_text: Optional[str]) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update((full_text or "").encode("utf-8"))
+        for segment in transcript_segments:
+            digest.update(
+                f"\x1e{segment.get('speaker')}\x1f{segment.get('start', 0)}\x1f{segment.get('end', 0)}"
+                f"\x1f{segment.get('text', '')}".encode("utf-8")
+            )
+        return digest.digest()
 
-    def summarize(
-            self, transcript_data: Dict[str, Any],
-            include_action_items: bool = True,
-            max_summary_length: int = 150,
-            min_summary_length: int = 30,
-            num_extractive_sentences: int = 5
+    def _analyze_transcript(
+            self, transcript_segments: List[Dict[str, Any]],
+            full_text: Optional[str],
+            include_action_items: bool,
+            num_extractive_sentences: int
     ) -> Dict[str, Any]:
-        logger.info("Starting summarization process")
+        cache_key = (
+            self._transcript_key(transcript_segments, full_text),
+            include_action_items,
+            num_extractive_sentences
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached transcript analysis")
+            self._analysis_cache.move_to_end(cache_key)
+            return cached
 
         # Preprocess transcript
-        full_text, speakers_utterances = self._preprocess_transcript(transcript_data)
-
-        # Extract metadata
-        metadata = transcript_data.get("metadata", {})
-
-        # Get transcript segments
-        transcript_segments = transcript_data.get("transcript", [])
-
-        # Generate abstractive summary using the chunking approach for long text
-        abstractive_summary = self._generate_abstractive_summary_for_long_text(
-            full_text,
-            max_length=max_summary_length,
-            min_length=min_summary_length
+        full_text, content, speaker_stats = self._preprocess_transcript(
+            transcript_segments,
+            full_text=full_text
         )
 
         # Generate extractive summary
         extractive_segments = self._generate_extractive_summary(
-            transcript_segments,
+            content,
             n_sentences=num_extractive_sentences
         )
-        extractive_summary = [seg.get("text", "") for seg in extractive_segments]
-
-        # Identify key topics
-        key_topics = self._identify_key_topics(full_text)
 
         # Extract action items if requested
         action_items = []
         if include_action_items:
-            action_items = self._extract_action_items(transcript_segments)
+            action_items = self._extract_action_items(content)
+
+        analysis = {
+            "full_text": full_text,
+            "speaker_stats": speaker_stats,
+            "extractive": [seg.get("text", "") for seg in extractive_segments],
+            # Identify key topics
+            "key_topics": self._identify_key_topics(full_text),
+            "action_items": action_items
+        }
 
-        # Prepare speaker statistics
-        speaker_stats = {}
-        for speaker, utterances in speakers_utterances.items():
-            # Skip instructional or unknown speakers
-            if speaker in ["Speaker_00", "Unknown"]:
-                continue
+        self._analysis_cache[cache_key] = analysis
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
 
-            # Calculate speaking time
-            speaking_time = sum(utt.get("end", 0) - utt.get("start", 0) for utt in utterances)
+        return analysis
 
-            # Count utterances
-            num_utterances = len(utterances)
+    def summarize(
+            self, transcript_data: Dict[str, Any],
+            include_action_items: bool = True,
+            max_summary_length: int = 150,
+            min_summary_length: int = 30,
+            num_extractive_sentences: int = 5
+    ) -> Dict[str, Any]:
+        logger.info("Starting summarization process")
 
-            # Calculate average utterance length
-            total_words = sum(len(utt.get("text", "").split()) for utt in utterances)
-            avg_words = total_words / num_utterances if num_utterances > 0 else 0
+        # Bind the transcript fields once
+        transcript_segments = transcript_data.get("transcript", [])
+        metadata = transcript_data.get("metadata", {})
 
-            speaker_stats[speaker] = {
-                "speaking_time": speaking_time,
-                "utterances": num_utterances,
-                "avg_words_per_utterance": avg_words,
-                "total_words": total_words
-            }
+        # Everything except the abstractive summary only depends on the transcript itself
+        analysis = self._analyze_transcript(
+            transcript_segments,
+            transcript_data.get("full_text"),
+            include_action_items,
+            num_extractive_sentences
+        )
+        full_text = analysis["full_text"]
+        speaker_stats = {speaker: dict(stats) for speaker, stats in analysis["speaker_stats"].items()}
+        extractive_summary = list(analysis["extractive"])
+        key_topics = list(analysis["key_topics"])
+        action_items = list(analysis["action_items"])
+
+        # Generate abstractive summary using the chunking approach for long text
+        abstractive_summary = self._generate_abstractive_summary_for_long_text(
+            full_text,
+            max_length=max_summary_length,
+            min_length=min_summary_length
+        )
 
         # Prepare summary results
         summary_results = {
@@ -535,7 +886,7 @@ class MeetingSummarizer:
                 "summary_generated": "yes",
                 "duration": metadata.get("duration", 0),
                 "language": metadata.get("language", "en"),
-                "num_speakers": len([s for s in speakers_utterances.keys() if s not in ["Speaker_00", "Unknown"]])
+                "num_speakers": len(speaker_stats)
             },
             "summary": {
                 "abstractive": abstractive_summary,
@@ -557,8 +908,15 @@ class MeetingSummarizer:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
             # Write the summary to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(summary_results, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        summary_results,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(summary_results, f, indent=2, ensure_ascii=False)
 
             logger.info(f"Summary saved successfully to {output_path}")
 
@@ -572,46 +930,50 @@ class MeetingSummarizer:
             # Ensure directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+            # Assemble the whole document in memory and write it once
+            summary = summary_results["summary"]
+            parts = ["=== MEETING SUMMARY ===\n\n"]
+
+            # Write abstractive summary
+            parts.append("OVERVIEW:\n")
+            parts.append(summary["abstractive"])
+            parts.append("\n\n")
+
+            # Write key topics
+            parts.append("KEY TOPICS:\n")
+            parts.extend(f"{i}. {topic}\n" for i, topic in enumerate(summary["key_topics"], 1))
+            parts.append("\n")
+
+            # Write key quotes (extractive)
+            parts.append("KEY QUOTES:\n")
+            parts.extend(f"- {quote}\n" for quote in summary["extractive"])
+            parts.append("\n")
+
+            # Write action items if any
+            if summary["action_items"]:
+                parts.append("ACTION ITEMS:\n")
+                parts.extend(f"- {item}\n" for item in summary["action_items"])
+                parts.append("\n")
+
+            # Write speaker statistics
+            parts.append("SPEAKER STATISTICS:\n")
+            for speaker, stats in summary_results["speaker_stats"].items():
+                parts.append(
+                    f"- {speaker}:\n"
+                    f"  Speaking time: {stats['speaking_time']:.1f} seconds\n"
+                    f"  Utterances: {stats['utterances']}\n"
+                    f"  Words: {stats['total_words']}\n"
+                )
+
+            # Write metadata
+            metadata = summary_results['metadata']
+            parts.append("\n=== METADATA ===\n")
+            parts.append(f"Duration: {metadata['duration']:.1f} seconds\n")
+            parts.append(f"Language: {metadata['language']}\n")
+            parts.append(f"Number of participants: {metadata['num_speakers']}\n")
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("=== MEETING SUMMARY ===\n\n")
-
-                # Write abstractive summary
-                f.write("OVERVIEW:\n")
-                f.write(summary_results["summary"]["abstractive"])
-                f.write("\n\n")
-
-                # Write key topics
-                f.write("KEY TOPICS:\n")
-                for i, topic in enumerate(summary_results["summary"]["key_topics"], 1):
-                    f.write(f"{i}. {topic}\n")
-                f.write("\n")
-
-                # Write key quotes (extractive)
-                f.write("KEY QUOTES:\n")
-                for quote in summary_results["summary"]["extractive"]:
-                    f.write(f"- {quote}\n")
-                f.write("\n")
-
-                # Write action items if any
-                if summary_results["summary"]["action_items"]:
-                    f.write("ACTION ITEMS:\n")
-                    for item in summary_results["summary"]["action_items"]:
-                        f.write(f"- {item}\n")
-                    f.write("\n")
-
-                # Write speaker statistics
-                f.write("SPEAKER STATISTICS:\n")
-                for speaker, stats in summary_results["speaker_stats"].items():
-                    f.write(f"- {speaker}:\n")
-                    f.write(f"  Speaking time: {stats['speaking_time']:.1f} seconds\n")
-                    f.write(f"  Utterances: {stats['utterances']}\n")
-                    f.write(f"  Words: {stats['total_words']}\n")
-
-                # Write metadata
-                f.write("\n=== METADATA ===\n")
-                f.write(f"Duration: {summary_results['metadata']['duration']:.1f} seconds\n")
-                f.write(f"Language: {summary_results['metadata']['language']}\n")
-                f.write(f"Number of participants: {summary_results['metadata']['num_speakers']}\n")
+                f.write("".join(parts))
 
             logger.info(f"Text summary saved successfully to {output_path}")
 
@@ -625,77 +987,81 @@ class MeetingSummarizer:
             # Ensure directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write("# Meeting Summary\n\n")
-                
-                # Write metadata at the top
-                metadata = summary_results['metadata']
-                duration_min = metadata['duration'] / 60
-                f.write(f"**Duration**: {duration_min:.1f} minutes | ")
-                f.write(f"**Participants**: {metadata['num_speakers']} | ")
-                f.write(f"**Language**: {metadata['language']}\n\n")
-                f.write("---\n\n")
-
-                # Write abstractive summary (main overview)
-                f.write("## Overview\n\n")
-                abstractive = summary_results["summary"]["abstractive"]
-                if abstractive and len(abstractive.strip()) > 10:
-                    f.write(abstractive)
-                else:
-                    # Fallback: create overview from key quotes if abstractive failed
-                    f.write("This meeting covered the following key points:\n\n")
-                    for i, quote in enumerate(summary_results["summary"]["extractive"][:3], 1):
-                        f.write(f"{i}. {quote}\n")
-                f.write("\n\n")
-
-                # Write key topics with better formatting
-                key_topics = summary_results["summary"]["key_topics"]
-                if key_topics:
-                    f.write("## Key Topics Discussed\n\n")
-                    for i, topic in enumerate(key_topics, 1):
-                        f.write(f"{i}. **{topic}**\n")
-                    f.write("\n")
-
-                # Write key quotes (extractive) with better formatting
-                extractive = summary_results["summary"]["extractive"]
-                if extractive:
-                    f.write("## Important Discussion Points\n\n")
-                    for i, quote in enumerate(extractive, 1):
-                        # Clean the quote
-                        cleaned_quote = quote.strip()
-                        f.write(f"{i}. *\"{cleaned_quote}\"*\n\n")
-
-                # Write action items if any
-                action_items = summary_results["summary"]["action_items"]
-                if action_items:
-                    f.write("## Action Items\n\n")
-                    for item in action_items:
-                        f.write(f"- [ ] {item}\n")
-                    f.write("\n")
-                else:
-                    f.write("## Action Items\n\n")
-                    f.write("*No specific action items identified in this meeting.*\n\n")
-
-                # Write speaker statistics
-                f.write("## Speaker Statistics\n\n")
-                f.write("| Speaker | Speaking Time | Utterances | Total Words | Avg Words/Utterance |\n")
-                f.write("|---------|---------------|------------|-------------|---------------------|\n")
-                
-                # Sort speakers by speaking time
-                sorted_speakers = sorted(
-                    summary_results["speaker_stats"].items(),
-                    key=lambda x: x[1]['speaking_time'],
-                    reverse=True
+            # Assemble the whole document in memory and write it once
+            parts = ["# Meeting Summary\n\n"]
+
+            # Write metadata at the top
+            metadata = summary_results['metadata']
+            duration_min = metadata['duration'] / 60
+            parts.append(
+                f"**Duration**: {duration_min:.1f} minutes | "
+                f"**Participants**: {metadata['num_speakers']} | "
+                f"**Language**: {metadata['language']}\n\n"
+            )
+            parts.append("---\n\n")
+
+            # Write abstractive summary (main overview)
+            parts.append("## Overview\n\n")
+            abstractive = summary_results["summary"]["abstractive"]
+            if abstractive and len(abstractive.strip()) > 10:
+                parts.append(abstractive)
+            else:
+                # Fallback: create overview from key quotes if abstractive failed
+                parts.append("This meeting covered the following key points:\n\n")
+                parts.extend(
+                    f"{i}. {quote}\n"
+                    for i, quote in enumerate(summary_results["summary"]["extractive"][:3], 1)
                 )
-                
-                for speaker, stats in sorted_speakers:
-                    time_min = stats['speaking_time'] / 60
-                    f.write(f"| {speaker} | {time_min:.1f} min | {stats['utterances']} | {stats['total_words']} | {stats['avg_words_per_utterance']:.1f} |\n")
+            parts.append("\n\n")
+
+            # Write key topics with better formatting
+            key_topics = summary_results["summary"]["key_topics"]
+            if key_topics:
+                parts.append("## Key Topics Discussed\n\n")
+                parts.extend(f"{i}. **{topic}**\n" for i, topic in enumerate(key_topics, 1))
+                parts.append("\n")
+
+            # Write key quotes (extractive) with better formatting
+            extractive = summary_results["summary"]["extractive"]
+            if extractive:
+                parts.append("## Important Discussion Points\n\n")
+                # Clean the quote
+                parts.extend(f"{i}. *\"{quote.strip()}\"*\n\n" for i, quote in enumerate(extractive, 1))
+
+            # Write action items if any
+            action_items = summary_results["summary"]["action_items"]
+            parts.append("## Action Items\n\n")
+            if action_items:
+                parts.extend(f"- [ ] {item}\n" for item in action_items)
+                parts.append("\n")
+            else:
+                parts.append("*No specific action items identified in this meeting.*\n\n")
+
+            # Write speaker statistics
+            parts.append("## Speaker Statistics\n\n")
+            parts.append("| Speaker | Speaking Time | Utterances | Total Words | Avg Words/Utterance |\n")
+            parts.append("|---------|---------------|------------|-------------|---------------------|\n")
+            
+            # Sort speakers by speaking time
+            sorted_speakers = sorted(
+                summary_results["speaker_stats"].items(),
+                key=lambda x: x[1]['speaking_time'],
+                reverse=True
+            )
+            
+            parts.extend(
+                f"| {speaker} | {stats['speaking_time'] / 60:.1f} min | {stats['utterances']} | "
+                f"{stats['total_words']} | {stats['avg_words_per_utterance']:.1f} |\n"
+                for speaker, stats in sorted_speakers
+            )
 
-                f.write("\n---\n")
-                f.write(f"\n*Summary generated on {metadata.get('original_metadata', {}).get('timestamp', 'N/A')}*\n")
+            parts.append("\n---\n")
+            parts.append(f"\n*Summary generated on {metadata.get('original_metadata', {}).get('timestamp', 'N/A')}*\n")
+
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
 
             logger.info(f"Markdown summary saved successfully to {output_path}")
 
         except Exception as e:
-            logger.error(f"Error saving markdown summary: {e}")
\ No newline at end of file
+            logger.error(f"Error saving markdown summary: {e}")
@@ -1,73 +1,69 @@
 import os
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import functools
+import contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Iterator, TextIO
 from dataclasses import dataclass, field
 from datetime import datetime
-from groq import Groq
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from groq import Groq, AsyncGroq
+
+# Load environment variables (python-dotenv is only imported when the key is not set yet);
+# the Groq SDK is imported when the first client is created
+if not os.getenv("GROQ_API_KEY"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# orjson parses and serializes in C; fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
-class MeetingSummaryResult:
-    title: str
-    overview: str
-    key_points: List[str]
-    decisions: List[str]
-    discussion_topics: List[Dict[str, str]]
-    next_steps: List[str]
-    participants: List[str]
-    duration: float
-    model: str
-    processing_time: float
-    metadata: Dict[str, Any] = field(default_factory=dict)
+# ijson parses incrementally, so very large transcripts never exist as a full object tree
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
+# Transcript files at least this large are stream-parsed when ijson is installed,
+# reading this many bytes per chunk (ijson defaults to 64 KB)
+STREAM_PARSE_MIN_BYTES = 50 * 1024 * 1024
+STREAM_PARSE_BUF_SIZE = 4 * 1024 * 1024
 
-class LLMSummarizer:
-    
-    def __init__(
-        self,
-        api_key: Optional[str] = None,
-        model: str = "llama-3.3-70b-versatile"
-    ):
-        self.api_key = api_key or os.getenv("GROQ_API_KEY")
-        if not self.api_key:
-            raise ValueError(
-                "API key required. Set GROQ_API_KEY environment variable."
-            )
-        
-        self.client = Groq(api_key=self.api_key)
-        self.model = model
-        logger.info(f"LLMSummarizer initialized with model: {model}")
-    
-    def _build_transcript_text(self, transcript_data: Dict) -> str:
-        segments = transcript_data.get('transcript', [])
-        
-        lines = []
-        for seg in segments:
-            speaker = seg.get('speaker', 'Unknown')
-            text = seg.get('text', '').strip()
-            if text:
-                lines.append(f"{speaker}: {text}")
-        
-        return "\n".join(lines)
-    
-    def _build_prompt(self, transcript_text: str) -> str:
-        return f"""You are an expert meeting analyst. Analyze this meeting transcript and provide a comprehensive summary.
+# Parser event prefixes of the segment fields kept when stream-parsing
+SEGMENT_FIELD_PREFIXES = {'transcript.item.speaker': 'speaker', 'transcript.item.text': 'text'}
+
+# Transcript characters sent to the LLM; longer transcripts are cut at a segment boundary
+MAX_TRANSCRIPT_CHARS = 15000
+
+
+# Static parts of the summarization prompt around the transcript, built once so every
+# request sends byte-identical instructions
+PROMPT_PREFIX = """You are an expert meeting analyst. Analyze this meeting transcript and provide a comprehensive summary.
 
 ## Meeting Transcript:
-{transcript_text}
+"""
+
+PROMPT_INSTRUCTIONS = """
 
 ## Instructions:
 Analyze the transcript and extract the following information. Be specific and use actual names/details from the meeting.
 
-Respond in this exact JSON format:
-{{
+"""
+
+# Output example, only sent when the API cannot enforce SUMMARY_SCHEMA itself
+SUMMARY_FORMAT_EXAMPLE = """{
     "title": "A concise title for this meeting (max 10 words)",
     "overview": "A 2-3 sentence executive summary of the entire meeting",
     "key_points": [
@@ -82,8 +78,8 @@ Respond in this exact JSON format:
         "... (list all decisions made, or empty array if none)"
     ],
     "discussion_topics": [
-        {{"topic": "Topic name", "summary": "Brief summary of what was discussed about this topic"}},
-        {{"topic": "Another topic", "summary": "Summary of this discussion"}}
+        {"topic": "Topic name", "summary": "Brief summary of what was discussed about this topic"},
+        {"topic": "Another topic", "summary": "Summary of this discussion"}
     ],
     "next_steps": [
         "Next step or follow-up item 1",
@@ -95,39 +91,212 @@ Respond in this exact JSON format:
         "Participant 2",
         "... (all identified speakers/participants)"
     ]
-}}
+}"""
+PROMPT_FORMAT_EXAMPLE = "Respond in this exact JSON format:\n" + SUMMARY_FORMAT_EXAMPLE + "\n\n"
 
-Important:
+PROMPT_RULES = """Important:
 - Extract ONLY information that is actually in the transcript
 - Use specific names, dates, and details when mentioned
 - If a section has no relevant content, use an empty array []
 - Keep the overview concise but informative
 - Respond with valid JSON only, no additional text"""
 
-    def summarize(
+PROMPT_SUFFIX = PROMPT_INSTRUCTIONS + PROMPT_FORMAT_EXAMPLE + PROMPT_RULES
+SCHEMA_PROMPT_SUFFIX = PROMPT_INSTRUCTIONS + PROMPT_RULES
+
+# JSON schema of the summary, mirroring MeetingSummaryResult
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "overview": {"type": "string"},
+        "key_points": _STRING_LIST,
+        "decisions": _STRING_LIST,
+        "discussion_topics": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "topic": {"type": "string"},
+                    "summary": {"type": "string"}
+                },
+                "required": ["topic", "summary"],
+                "additionalProperties": False
+            }
+        },
+        "next_steps": _STRING_LIST,
+        "participants": _STRING_LIST
+    },
+    "required": ["title", "overview", "key_points", "decisions", "discussion_topics", "next_steps", "participants"],
+    "additionalProperties": False
+}
+
+# Values for summary fields missing from the LLM response (tuples, so the shared
+# defaults cannot be mutated through a result)
+SUMMARY_DEFAULTS = {
+    "title": "Meeting Summary",
+    "overview": "",
+    "key_points": (),
+    "decisions": (),
+    "discussion_topics": (),
+    "next_steps": (),
+    "participants": ()
+}
+DEDUPLICATED_FIELDS = ("key_points", "decisions", "next_steps", "participants")
+
+# Groq models that accept response_format json_schema, and whether they support strict
+# (constrained) decoding; other models get JSON mode plus the example in the prompt
+STRUCTURED_OUTPUT_MODELS = {
+    "openai/gpt-oss-20b": True,
+    "openai/gpt-oss-120b": True,
+    "moonshotai/kimi-k2-instruct": False,
+    "meta-llama/llama-4-maverick-17b-128e-instruct": False,
+    "meta-llama/llama-4-scout-17b-16e-instruct": False,
+}
+
+
+# Layout of the markdown summary; list sections are rendered separately
+MARKDOWN_TEMPLATE = """# {title}
+
+## 📋 Overview
+
+{overview}
+
+## 👥 Participants
+
+{participants}
+## 🔑 Key Points
+
+{key_points}
+## 💡 Decisions Made
+
+{decisions}
+## 📝 Discussion Topics
+
+{discussion_topics}
+## ➡️ Next Steps
+
+{next_steps}
+---
+
+*Generated: {generated}*  
+*Model: {model}*  
+*Processing time: {processing_time:.1f}s*
+"""
+
+
+@dataclass(slots=True)
+class MeetingSummaryResult:
+    title: str
+    overview: str
+    key_points: List[str]
+    decisions: List[str]
+    discussion_topics: List[Dict[str, str]]
+    next_steps: List[str]
+    participants: List[str]
+    duration: float
+    model: str
+    processing_time: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_groq_client(api_key: str) -> "Groq":
+    from groq import Groq
+    return Groq(api_key=api_key)
+
+
+class LLMSummarizer:
+    
+    def __init__(
         self,
-        transcript_data: Dict,
-        max_tokens: int = 2000,
-        temperature: float = 0.3
-    ) -> MeetingSummaryResult:
-        start_time = datetime.now()
+        api_key: Optional[str] = None,
+        model: str = "llama-3.3-70b-versatile",
+        async_client: Optional["AsyncGroq"] = None
+    ):
+        self.api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not self.api_key:
+            raise ValueError(
+                "API key required. Set GROQ_API_KEY environment variable."
+            )
         
-        # Build transcript text
+        # The sync client (and its connection pool) is shared by every summarizer with
+        # the same key; the async one is bound to an event loop, so it is either passed
+        # in by the application that owns the loop or created per instance
+        self.client = _get_groq_client(self.api_key)
+        self._async_client = async_client
+        self.model = model
+        logger.info(f"LLMSummarizer initialized with model: {model}")
+    
+    @property
+    def async_client(self) -> "AsyncGroq":
+        """Async client, created on first async call."""
+        if self._async_client is None:
+            from groq import AsyncGroq
+            self._async_client = AsyncGroq(api_key=self.api_key)
+        return self._async_client
+    
+    def _build_transcript_text(self, transcript_data: Dict, max_chars: int = MAX_TRANSCRIPT_CHARS) -> str:
+        segments = transcript_data.get('transcript', ())
+        
+        # One "Speaker: text" line per non-empty segment, stopping at the last whole
+        # segment that fits the budget instead of formatting lines that get cut off
+        lines = []
+        total = 0
+        for seg in segments:
+            text = seg.get('text', '').strip()
+            if not text:
+                continue
+            line = f"{seg.get('speaker', 'Unknown')}: {text}"
+            total += len(line) + 1
+            if total > max_chars + 1:  # the last line has no trailing newline
+                if not lines:
+                    # A single oversized segment still contributes what fits
+                    lines.append(line[:max_chars])
+                lines.append("\n[Transcript truncated...]")
+                break
+            lines.append(line)
+        
+        return "\n".join(lines)
+    
+    def _build_prompt(self, transcript_text: str, format_example: bool = True) -> str:
+        suffix = PROMPT_SUFFIX if format_example else SCHEMA_PROMPT_SUFFIX
+        return PROMPT_PREFIX + transcript_text + suffix
+
+    def _build_request(
+        self,
+        transcript_data: Dict,
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        # Build transcript text (truncated to ~15k chars for context)
         transcript_text = self._build_transcript_text(transcript_data)
         
-        # Truncate if too long (keep ~15k chars for context)
-        if len(transcript_text) > 15000:
-            transcript_text = transcript_text[:15000] + "\n\n[Transcript truncated...]"
+        # Let the API enforce the schema where the model supports it, which also makes
+        # the JSON example in the prompt unnecessary. JSON modes cannot be combined with
+        # streaming, so streamed requests rely on the prompt alone.
+        strict = STRUCTURED_OUTPUT_MODELS.get(self.model)
+        if stream:
+            response_format = None
+        elif strict is not None:
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {"name": "MeetingSummary", "schema": SUMMARY_SCHEMA, "strict": strict}
+            }
+        else:
+            response_format = {"type": "json_object"}
         
         # Build prompt
-        prompt = self._build_prompt(transcript_text)
-        
-        # Call LLM API
-        logger.info("Calling LLM API for summarization...")
+        prompt = self._build_prompt(
+            transcript_text,
+            format_example=response_format is None or response_format["type"] != "json_schema"
+        )
         
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+        request = {
+            "model": self.model,
+            "messages": [
                 {
                     "role": "system",
                     "content": "You are an expert meeting analyst. Always respond with valid JSON only."
@@ -137,54 +306,151 @@ Important:
                     "content": prompt
                 }
             ],
-            temperature=temperature,
-            max_tokens=max_tokens,
-            response_format={"type": "json_object"}
-        )
-        
-        # Parse response
-        response_text = response.choices[0].message.content
-        
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        if response_format is not None:
+            request["response_format"] = response_format
+        return request
+    
+    def _build_result(
+        self,
+        transcript_data: Dict,
+        response_text: str,
+        processing_time: float
+    ) -> MeetingSummaryResult:
         try:
-            summary_data = json.loads(response_text)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            summary_data = orjson.loads(response_text) if ORJSON_AVAILABLE else json.loads(response_text)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {e}")
             # Fallback to basic structure
-            summary_data = {
-                "title": "Meeting Summary",
-                "overview": response_text[:500],
-                "key_points": [],
-                "decisions": [],
-                "discussion_topics": [],
-                "next_steps": [],
-                "participants": []
-            }
+            summary_data = {"overview": response_text[:500]}
         
-        processing_time = (datetime.now() - start_time).total_seconds()
+        return self.result_from_data(transcript_data, summary_data, processing_time)
+    
+    def result_from_data(
+        self,
+        transcript_data: Dict,
+        summary_data: Dict[str, Any],
+        processing_time: float
+    ) -> MeetingSummaryResult:
+        # Fill missing (or null) fields from the defaults in one merge; list fields get
+        # fresh lists, deduplicated where the LLM tends to repeat itself
+        fields = {
+            **SUMMARY_DEFAULTS,
+            **{key: value for key, value in summary_data.items() if value is not None}
+        }
+        topics = fields["discussion_topics"]
+        fields["discussion_topics"] = list(topics) if isinstance(topics, (list, tuple)) else []
+        for key in DEDUPLICATED_FIELDS:
+            fields[key] = _unique_items(fields[key])
         
         # Get duration from transcript metadata
-        duration = transcript_data.get('metadata', {}).get('duration', 0)
-        
-        result = MeetingSummaryResult(
-            title=summary_data.get('title', 'Meeting Summary'),
-            overview=summary_data.get('overview', ''),
-            key_points=summary_data.get('key_points', []),
-            decisions=summary_data.get('decisions', []),
-            discussion_topics=summary_data.get('discussion_topics', []),
-            next_steps=summary_data.get('next_steps', []),
-            participants=summary_data.get('participants', []),
-            duration=duration,
+        metadata = transcript_data.get('metadata', {})
+        
+        return MeetingSummaryResult(
+            **{key: fields[key] for key in SUMMARY_DEFAULTS},
+            duration=metadata.get('duration', 0),
             model=self.model,
             processing_time=processing_time,
             metadata={
-                "source_file": transcript_data.get('metadata', {}).get('file', 'unknown'),
+                "source_file": metadata.get('file', 'unknown'),
                 "transcript_segments": len(transcript_data.get('transcript', []))
             }
         )
+
+    def summarize(
+        self,
+        transcript_data: Dict,
+        max_tokens: int = 2000,
+        temperature: float = 0.3
+    ) -> MeetingSummaryResult:
+        start_time = time.perf_counter()
+        
+        request = self._build_request(transcript_data, max_tokens, temperature)
+        
+        # Call LLM API
+        logger.info("Calling LLM API for summarization...")
+        response = self.client.chat.completions.create(**request)
+        
+        # Parse response
+        response_text = response.choices[0].message.content
+        processing_time = time.perf_counter() - start_time
+        result = self._build_result(transcript_data, response_text, processing_time)
+        
+        logger.info(f"Summarization completed in {processing_time:.1f}s")
+        return result
+    
+    def summarize_stream(
+        self,
+        transcript_data: Dict,
+        max_tokens: int = 2000,
+        temperature: float = 0.3
+    ) -> Iterator[str]:
+        # Yields response text as it arrives; the parsed MeetingSummaryResult is the
+        # generator's return value (e.g. `result = yield from summarize_stream(...)`)
+        start_time = time.perf_counter()
+        
+        # Streaming cannot use JSON mode; the prompt and system message still ask for JSON
+        request = self._build_request(transcript_data, max_tokens, temperature, stream=True)
+        
+        logger.info("Calling LLM API for summarization (streaming)...")
+        response = self.client.chat.completions.create(stream=True, **request)
+        
+        buffer = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                buffer.append(delta)
+                yield delta
+        
+        processing_time = time.perf_counter() - start_time
+        result = self._build_result(transcript_data, "".join(buffer), processing_time)
+        
+        logger.info(f"Summarization completed in {processing_time:.1f}s")
+        return result
+    
+    async def asummarize(
+        self,
+        transcript_data: Dict,
+        max_tokens: int = 2000,
+        temperature: float = 0.3
+    ) -> MeetingSummaryResult:
+        start_time = time.perf_counter()
+        
+        request = self._build_request(transcript_data, max_tokens, temperature)
+        
+        # Call LLM API without blocking the event loop
+        logger.info("Calling LLM API for summarization (async)...")
+        response = await self.async_client.chat.completions.create(**request)
+        
+        # Parse response
+        response_text = response.choices[0].message.content
+        processing_time = time.perf_counter() - start_time
+        result = self._build_result(transcript_data, response_text, processing_time)
         
         logger.info(f"Summarization completed in {processing_time:.1f}s")
         return result
     
+    async def summarize_batch(
+        self,
+        transcripts: List[Dict],
+        max_concurrency: int = 4,
+        max_tokens: int = 2000,
+        temperature: float = 0.3
+    ) -> List[MeetingSummaryResult]:
+        # Requests run concurrently (results keep the input order); the semaphore
+        # keeps a large batch from tripping the API rate limits
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def summarize_one(transcript_data: Dict) -> MeetingSummaryResult:
+            async with semaphore:
+                return await self.asummarize(transcript_data, max_tokens, temperature)
+        
+        logger.info(f"Summarizing {len(transcripts)} transcripts (max {max_concurrency} concurrent)")
+        return await asyncio.gather(*(summarize_one(t) for t in transcripts))
+    
     def to_dict(self, result: MeetingSummaryResult) -> Dict:
         return {
             "status": "success",
@@ -204,94 +470,76 @@ Important:
         }
     
     def to_markdown(self, result: MeetingSummaryResult) -> str:
-        md = f"""# {result.title}
-
-## 📋 Overview
-
-{result.overview}
-
-## 👥 Participants
-
-"""
-        if result.participants:
-            for p in result.participants:
-                md += f"- {p}\n"
-        else:
-            md += "*No participants identified*\n"
-        
-        md += "\n## 🔑 Key Points\n\n"
-        if result.key_points:
-            for point in result.key_points:
-                md += f"- {point}\n"
-        else:
-            md += "*No key points identified*\n"
-        
-        md += "\n## 💡 Decisions Made\n\n"
-        if result.decisions:
-            for decision in result.decisions:
-                md += f"- {decision}\n"
-        else:
-            md += "*No decisions recorded*\n"
-        
-        md += "\n## 📝 Discussion Topics\n\n"
-        if result.discussion_topics:
-            for topic in result.discussion_topics:
-                topic_name = topic.get('topic', 'Topic')
-                topic_summary = topic.get('summary', '')
-                md += f"### {topic_name}\n\n{topic_summary}\n\n"
-        else:
-            md += "*No specific topics identified*\n"
-        
-        md += "\n## ➡️ Next Steps\n\n"
-        if result.next_steps:
-            for i, step in enumerate(result.next_steps, 1):
-                md += f"{i}. {step}\n"
-        else:
-            md += "*No next steps identified*\n"
-        
-        md += f"""
----
-
-*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*  
-*Model: {result.model}*  
-*Processing time: {result.processing_time:.1f}s*
-"""
-        return md
+        # Render each list section, then fill the fixed layout in one pass
+        return MARKDOWN_TEMPLATE.format_map({
+            "title": result.title,
+            "overview": result.overview,
+            "participants": _markdown_items(
+                (f"- {p}\n" for p in result.participants),
+                "*No participants identified*\n"
+            ),
+            "key_points": _markdown_items(
+                (f"- {point}\n" for point in result.key_points),
+                "*No key points identified*\n"
+            ),
+            "decisions": _markdown_items(
+                (f"- {decision}\n" for decision in result.decisions),
+                "*No decisions recorded*\n"
+            ),
+            "discussion_topics": _markdown_items(
+                (f"### {topic.get('topic', 'Topic')}\n\n{topic.get('summary', '')}\n\n"
+                 for topic in result.discussion_topics),
+                "*No specific topics identified*\n"
+            ),
+            "next_steps": _markdown_items(
+                (f"{i}. {step}\n" for i, step in enumerate(result.next_steps, 1)),
+                "*No next steps identified*\n"
+            ),
+            "generated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "model": result.model,
+            "processing_time": result.processing_time
+        })
     
     def save_json(self, result: MeetingSummaryResult, output_path: str) -> str:
-        from pathlib import Path
-        
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(result), f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.to_dict(result), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(self.to_dict(result), indent=2, ensure_ascii=False).encode('utf-8')
+        _atomic_write(output_path, data)
         
         logger.info(f"Summary saved to {output_path}")
         return str(output_path)
     
     def save_markdown(self, result: MeetingSummaryResult, output_path: str) -> str:
-        from pathlib import Path
-        
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(self.to_markdown(result))
+        _atomic_write(output_path, self.to_markdown(result).encode('utf-8'))
         
         logger.info(f"Summary saved to {output_path}")
         return str(output_path)
     
+    async def asave_json(self, result: MeetingSummaryResult, output_path: str) -> str:
+        # Disk I/O runs in a worker thread so the event loop keeps serving
+        return await asyncio.to_thread(self.save_json, result, output_path)
+    
+    async def asave_markdown(self, result: MeetingSummaryResult, output_path: str) -> str:
+        return await asyncio.to_thread(self.save_markdown, result, output_path)
+    
     def summarize_and_save(
         self,
         transcript_data: Dict,
         output_dir: str,
         base_name: str,
-        formats: List[str] = ["json", "md"]
+        formats: List[str] = ["json", "md"],
+        stream_to: Optional[TextIO] = None
     ) -> Dict[str, str]:
-        from pathlib import Path
-        
-        result = self.summarize(transcript_data)
+        if stream_to is not None:
+            # Write the raw response to the given handle while it is being generated
+            result = _drain_stream(self.summarize_stream(transcript_data), stream_to)
+        else:
+            result = self.summarize(transcript_data)
         output_path = Path(output_dir)
         
         saved_files = {}
@@ -305,6 +553,135 @@ Important:
                 saved_files['md'] = path
         
         return saved_files
+    
+    async def asummarize_and_save(
+        self,
+        transcript_data: Dict,
+        output_dir: str,
+        base_name: str,
+        formats: List[str] = ["json", "md"]
+    ) -> Dict[str, str]:
+        result = await self.asummarize(transcript_data)
+        output_path = Path(output_dir)
+        
+        # Write the requested formats concurrently
+        savers = {
+            'json': lambda: self.asave_json(result, output_path / f"{base_name}.json"),
+            'md': lambda: self.asave_markdown(result, output_path / f"{base_name}.md")
+        }
+        selected = [fmt for fmt in dict.fromkeys(formats) if fmt in savers]
+        paths = await asyncio.gather(*(savers[fmt]() for fmt in selected))
+        
+        return dict(zip(selected, paths))
+
+
+def _drain_stream(stream: Iterator[str], sink: TextIO) -> Any:
+    """Write every chunk of a streaming generator to sink and return its final value."""
+    while True:
+        try:
+            sink.write(next(stream))
+        except StopIteration as stop:
+            return stop.value
+
+
+# Output directories already created by this process
+_created_dirs = set()
+
+
+def _atomic_write(output_path: Path, data: bytes) -> None:
+    """Write data to a temporary file next to output_path, then rename it into place."""
+    parent = output_path.parent
+    if parent not in _created_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(parent)
+    
+    # Readers see either the previous file or the complete new one, never a partial write.
+    # The temporary name is unique per process and thread.
+    tmp_path = parent / f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        try:
+            f = open(tmp_path, 'wb')
+        except FileNotFoundError:
+            # The directory was removed after it was cached as created; make it again
+            parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp_path, 'wb')
+        with f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _unique_items(items: Any) -> List[Any]:
+    """Strip items and drop empty and case-insensitive repeats, keeping the first spelling."""
+    # The LLM may send null or a bare string instead of a list
+    if isinstance(items, str):
+        items = [items]
+    elif not isinstance(items, (list, tuple)):
+        return []
+    
+    seen = set()
+    unique = []
+    for item in items:
+        if isinstance(item, str):
+            text = item.strip()
+            key = text.casefold()
+            if text and key not in seen:
+                seen.add(key)
+                unique.append(text)
+        elif item is not None:
+            # Non-string items (e.g. participant objects) are kept as they are
+            unique.append(item)
+    return unique
+
+
+def _markdown_items(lines, empty_text: str) -> str:
+    """Join rendered list lines, or return the placeholder when there are none."""
+    return "".join(lines) or empty_text
+
+
+def _stream_transcript(transcript_file_path: str) -> Dict[str, Any]:
+    # Keep only the fields the summarizer reads; per-word timings and the like are skipped.
+    # Segments and metadata are collected from one pass over the parser events.
+    segments = []
+    segment = None
+    metadata = {}
+    metadata_builder = None
+    
+    # ijson pulls fixed-size chunks, so read straight from the raw file in large ones
+    with open(transcript_file_path, 'rb', buffering=0) as f:
+        for prefix, event, value in ijson.parse(f, use_float=True, buf_size=STREAM_PARSE_BUF_SIZE):
+            if metadata_builder is not None:
+                metadata_builder.event(event, value)
+                if prefix == 'metadata' and event == 'end_map':
+                    metadata = metadata_builder.value
+                    metadata_builder = None
+            elif prefix == 'transcript.item':
+                if event == 'start_map':
+                    segment = {"speaker": "Unknown", "text": ""}
+                elif event == 'end_map':
+                    segments.append(segment)
+            elif prefix in SEGMENT_FIELD_PREFIXES and event not in ('start_map', 'start_array'):
+                segment[SEGMENT_FIELD_PREFIXES[prefix]] = value
+            elif prefix == 'metadata' and event == 'start_map':
+                metadata_builder = ijson.ObjectBuilder()
+                metadata_builder.event(event, value)
+    return {"transcript": segments, "metadata": metadata}
+
+
+def load_transcript(transcript_file_path: str) -> Dict[str, Any]:
+    """Load a transcript JSON file, stream-parsing it when it is very large."""
+    if IJSON_AVAILABLE and os.path.getsize(transcript_file_path) >= STREAM_PARSE_MIN_BYTES:
+        logger.info(f"Stream-parsing large transcript {transcript_file_path}")
+        return _stream_transcript(transcript_file_path)
+    
+    if ORJSON_AVAILABLE:
+        with open(transcript_file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(transcript_file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 
 # Convenience function
@@ -319,8 +696,7 @@ def summarize_meeting_llm(
     if transcript_data is None:
         if transcript_file_path is None:
             raise ValueError("Either transcript_file_path or transcript_data required")
-        with open(transcript_file_path, 'r', encoding='utf-8') as f:
-            transcript_data = json.load(f)
+        transcript_data = load_transcript(transcript_file_path)
     
     summarizer = LLMSummarizer(model=model)
     result = summarizer.summarize(transcript_data)
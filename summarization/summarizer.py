@@ -1,6 +1,9 @@
-from summarization.core.meeting_summarizer import MeetingSummarizer
+from summarization.core.meeting_summarizer import MeetingSummarizer, ORJSON_AVAILABLE
 from typing import Dict, Optional, Any
 
+if ORJSON_AVAILABLE:
+    import orjson
+
 
 def summarize_meeting(
         transcript_file_path: str,
@@ -8,16 +11,22 @@ def summarize_meeting(
         output_format: str = "json",
         output_file: Optional[str] = None,
         extract_action_items: bool = True,
-        summary_length: Dict[str, int] = {"max": 150, "min": 30}
+        summary_length: Dict[str, int] = {"max": 150, "min": 30},
+        backend: str = "torch"
 ) -> Dict[str, Any]:
     summarizer = MeetingSummarizer(
-        model_path=model_name
+        model_path=model_name,
+        backend=backend
     )
 
     # Load transcript data
-    import json
-    with open(transcript_file_path, 'r', encoding='utf-8') as f:
-        transcript_data = json.load(f)
+    if ORJSON_AVAILABLE:
+        with open(transcript_file_path, 'rb') as f:
+            transcript_data = orjson.loads(f.read())
+    else:
+        import json
+        with open(transcript_file_path, 'r', encoding='utf-8') as f:
+            transcript_data = json.load(f)
 
     # Generate summary
     summary_results = summarizer.summarize(
@@ -0,0 +1,105 @@
+import time
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+
+from summarization.llm_summarizer import (
+    LLMSummarizer,
+    MeetingSummaryResult,
+    PROMPT_PREFIX,
+    PROMPT_INSTRUCTIONS,
+    PROMPT_RULES,
+    SUMMARY_FORMAT_EXAMPLE,
+    MAX_TRANSCRIPT_CHARS,
+)
+from action_item_extraction.ml_extractor import LLMActionItemExtractor
+
+logger = logging.getLogger(__name__)
+
+# The two tasks reuse the summarizer's and the extractor's own instructions and
+# examples; only the envelope around them is specific to the combined request
+COMBINED_OUTPUT_FORMAT = """
+
+## Output:
+Return ONE JSON object with two keys, "summary" (the Task 1 object) and "action_items"
+(the Task 2 array):
+{"summary": {...}, "action_items": [...]}
+
+Return ONLY the JSON, no additional text."""
+
+
+class CombinedAnalyzer:
+
+    def __init__(self, summarizer: LLMSummarizer, extractor: LLMActionItemExtractor):
+        self.summarizer = summarizer
+        self.extractor = extractor
+
+    async def analyze(
+        self,
+        transcript_data: Dict[str, Any],
+        max_tokens: int = 4000,
+        temperature: float = 0.2
+    ) -> Optional[Tuple[MeetingSummaryResult, Dict[str, Any]]]:
+        # One request for the summary and the action items, so the transcript is sent
+        # and read once. Returns None when the caller should use the separate calls:
+        # extraction disabled, a transcript the summarizer would truncate, or a
+        # response that fails to parse or lacks either part.
+        if not self.extractor.enabled:
+            return None
+
+        segments = transcript_data.get('transcript', [])
+        conversation = self.extractor.build_conversation_text(segments)
+        if len(conversation) > MAX_TRANSCRIPT_CHARS:
+            return None
+
+        speakers = self.extractor.extract_speakers(segments)
+
+        start_time = time.perf_counter()
+        try:
+            logger.info("Calling LLM API for combined summary and action items...")
+            response = await self.summarizer.async_client.chat.completions.create(
+                model=self.summarizer.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert meeting analyst. Always respond with valid JSON only."
+                    },
+                    {
+                        "role": "user",
+                        "content": self._build_prompt(conversation, speakers)
+                    }
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            )
+            data = orjson.loads(response.choices[0].message.content)
+            summary_data = data.get("summary")
+            action_items = data.get("action_items")
+            if not isinstance(summary_data, dict) or not isinstance(action_items, list):
+                raise ValueError("response is missing the summary or action_items")
+
+            tasks = self.extractor.action_items_result(
+                [item for item in action_items if isinstance(item, dict)],
+                segments,
+                conversation
+            )
+            processing_time = time.perf_counter() - start_time
+            summary = self.summarizer.result_from_data(transcript_data, summary_data, processing_time)
+        except Exception as e:
+            logger.warning(f"Combined analysis failed, using separate requests: {e}")
+            return None
+
+        logger.info(f"Combined analysis completed in {processing_time:.1f}s")
+        return summary, tasks
+
+    def _build_prompt(self, conversation: str, speakers: List[str]) -> str:
+        speaker_list = ", ".join(speakers) if speakers else "unknown"
+        return (
+            PROMPT_PREFIX + conversation
+            + "\n\n## Task 1: Meeting summary"
+            + PROMPT_INSTRUCTIONS + "Use this JSON format:\n" + SUMMARY_FORMAT_EXAMPLE + "\n\n" + PROMPT_RULES
+            + f"\n\n## Task 2: Action items\nPARTICIPANTS: {speaker_list}\n\n"
+            + self.extractor.build_instructions(speakers)
+            + COMBINED_OUTPUT_FORMAT
+        )
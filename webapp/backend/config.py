@@ -1,4 +1,6 @@
 import os
+import logging
+import importlib.util
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -11,6 +13,11 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 
 CONFIG_FILE = Path(__file__).parent / "config.json"
 
+# Speaker assignments from LLM diarization, by transcript hash
+DIARIZATION_CACHE_DIR = Path(__file__).parent / "diarize_cache"
+DIARIZATION_CACHE_DIR.mkdir(exist_ok=True)
+DIARIZATION_CACHE_MAX_AGE_DAYS = 30
+
 # CORS settings
 CORS_ORIGINS = ["http://localhost:3000", "http://localhost:5173"]
 
@@ -19,3 +26,13 @@ ALLOWED_EXTENSIONS = {'.mp3', '.mp4', '.wav', '.m4a', '.webm', '.ogg', '.flac'}
 
 # Whisper model configuration
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "whisper")
+if WHISPER_BACKEND == "faster-whisper" and importlib.util.find_spec("faster_whisper") is None:
+    # Fail over at startup instead of failing every transcription job
+    logging.getLogger(__name__).warning(
+        "WHISPER_BACKEND=faster-whisper but faster-whisper is not installed; using whisper"
+    )
+    WHISPER_BACKEND = "whisper"
+
+# LLM diarization model; "llama-3.1-8b-instant" is the fast tier
+DIARIZER_MODEL = os.getenv("DIARIZER_MODEL", "llama-3.3-70b-versatile")
@@ -1,4 +1,6 @@
 import os
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from dotenv import load_dotenv
@@ -9,13 +11,30 @@ load_dotenv()
 DATABASE_URL = os.getenv(
     "DATABASE_URL")
 
+# Connection pool sizing. Routes like Jira issue creation hold their session across
+# slow outbound calls while processing jobs open their own for every status update;
+# keep (DB_POOL_SIZE + DB_MAX_OVERFLOW) x workers below Postgres max_connections (default 100)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+
+# asyncpg keeps prepared statements per connection; the app issues a small, fixed set
+# of queries, so a larger cache means they are parsed and planned once per connection
+connect_args = {}
+if DATABASE_URL and "+asyncpg" in DATABASE_URL:
+    connect_args = {
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    }
+
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL debugging
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,  # Replace connections older than 30 minutes
+    connect_args=connect_args,
 )
 
 # Session factory
@@ -43,9 +62,55 @@ async def get_db():
             await session.close()
 
 
+# Columns declared JSONB in db_models; tables created while they were still JSON are
+# converted on startup, since create_all does not alter existing tables
+JSONB_COLUMNS = (
+    ("meetings", "transcript"),
+    ("meetings", "summary"),
+    ("meetings", "assignee_mappings"),
+    ("jira_configurations", "user_mappings"),
+)
+
+# Large result columns, TOAST-compressed with lz4 (Postgres 14+) rather than the
+# default pglz: smaller on disk and much cheaper to decompress on every read
+LZ4_COLUMNS = ("transcript", "summary")
+
+
 async def create_tables():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        
+        result = await conn.execute(text(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND data_type = 'json'"
+        ))
+        for table, column in result.all():
+            if (table, column) in JSONB_COLUMNS:
+                await conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+                ))
+        
+        # Likewise, indexes added to db_models after a table was created
+        await conn.run_sync(_create_missing_indexes)
+        
+        if conn.dialect.server_version_info >= (14,):
+            result = await conn.execute(text(
+                "SELECT attname FROM pg_attribute "
+                "WHERE attrelid = 'meetings'::regclass AND attname = ANY(:columns) AND attcompression <> 'l'"
+            ), {"columns": list(LZ4_COLUMNS)})
+            for column in result.scalars().all():
+                try:
+                    async with conn.begin_nested():
+                        await conn.execute(text(f"ALTER TABLE meetings ALTER COLUMN {column} SET COMPRESSION lz4"))
+                except DBAPIError:
+                    # Server built without lz4; keep the default compression
+                    break
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
 
 
 async def drop_tables():
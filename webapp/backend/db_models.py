@@ -1,9 +1,9 @@
 import uuid
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Text, Float, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import String, Text, Float, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from database import Base
 
@@ -20,13 +20,18 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
-    # Relationships
-    meetings: Mapped[List["Meeting"]] = relationship("Meeting", back_populates="user", cascade="all, delete-orphan")
-    jira_config: Mapped[Optional["JiraConfiguration"]] = relationship("JiraConfiguration", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    # Relationships (never lazy-loaded: query or eager-load them explicitly, and let the
+    # database's ON DELETE CASCADE remove the rows)
+    meetings: Mapped[List["Meeting"]] = relationship("Meeting", back_populates="user", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    jira_config: Mapped[Optional["JiraConfiguration"]] = relationship("JiraConfiguration", back_populates="user", uselist=False, cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
 
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        # A user's completed meetings, newest first (the results list)
+        Index("ix_meetings_user_completed", "user_id", "created_at", postgresql_where=text("status = 'completed'")),
+    )
     
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     job_id: Mapped[str] = mapped_column(String(50), unique=True, index=True, nullable=False)
@@ -45,12 +50,12 @@ class Meeting(Base):
     message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    # Results stored as JSON
-    transcript: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # List of transcript segments
-    summary: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Summary dict
+    # Results stored as JSONB (parsed once on write, not on every read)
+    transcript: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # List of transcript segments
+    summary: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # Summary dict
     
     # Assignee mappings for this meeting
-    assignee_mappings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, default=dict)
+    assignee_mappings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -58,11 +63,15 @@ class Meeting(Base):
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="meetings")
-    tasks: Mapped[List["Task"]] = relationship("Task", back_populates="meeting", cascade="all, delete-orphan")
+    tasks: Mapped[List["Task"]] = relationship("Task", back_populates="meeting", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
 
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Postgres does not index foreign keys; every task lookup is by meeting
+        Index("ix_tasks_meeting_task", "meeting_id", "task_id"),
+    )
     
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     task_id: Mapped[str] = mapped_column(String(100), index=True, nullable=False)  # Original task ID from extraction
@@ -102,7 +111,7 @@ class JiraConfiguration(Base):
     project_key: Mapped[str] = mapped_column(String(50), nullable=False)
     
     # User mappings (meeting name -> jira account id)
-    user_mappings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, default=dict)
+    user_mappings: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True, default=dict)
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
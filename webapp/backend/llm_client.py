@@ -0,0 +1,37 @@
+import os
+import logging
+from typing import Optional
+import httpx
+from groq import AsyncGroq
+
+logger = logging.getLogger(__name__)
+
+# One AsyncGroq client (and keep-alive connection pool) shared by every LLM helper in
+# the app, so processing jobs reuse open TLS sessions to the API instead of opening
+# new ones per helper
+_client: Optional[AsyncGroq] = None
+
+
+def get_groq_client() -> Optional[AsyncGroq]:
+    global _client
+    if _client is None:
+        api_key = os.environ.get("GROQ_API_KEY")
+        if not api_key:
+            logger.warning("GROQ_API_KEY not found. LLM features will be disabled.")
+            return None
+        
+        _client = AsyncGroq(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                timeout=httpx.Timeout(600.0),
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        )
+    return _client
+
+
+async def close_groq_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -1,18 +1,69 @@
 import os
-import json
+import time
+import asyncio
+import hashlib
 import logging
+from collections import Counter, OrderedDict
 from typing import List, Dict, Any, Optional
-from groq import Groq
+import httpx
+import orjson
+from groq import AsyncGroq
+
+from config import DIARIZATION_CACHE_DIR, DIARIZATION_CACHE_MAX_AGE_DAYS
 
 logger = logging.getLogger(__name__)
 
+# Segments per diarization request, and how many earlier segments each chunk repeats
+# so its speaker labels can be matched to the previous chunk's
+CHUNK_SEGMENTS = 40
+CHUNK_OVERLAP = 5
+
+# Diarization requests in flight at once
+MAX_CONCURRENT_REQUESTS = 4
+
+# Output token budget per segment in a response
+TOKENS_PER_SEGMENT = 12
+
+# Labels for segments the LLM did not assign
+DEFAULT_SPEAKERS = tuple(f"Speaker_{i}" for i in range(10))
+
+# Recently used speaker assignments, in front of the on-disk cache
+MEMORY_CACHE_SIZE = 128
+_assignment_cache: "OrderedDict[str, Dict[int, str]]" = OrderedDict()
+
+
+def _free_speaker_label(used: set) -> str:
+    """First Speaker_A, Speaker_B, ... label not in used (numbered past Speaker_Z)."""
+    n = 0
+    while True:
+        label = f"Speaker_{chr(65 + n)}" if n < 26 else f"Speaker_{n + 1}"
+        if label not in used:
+            return label
+        n += 1
+
+
+def prune_diarization_cache(max_age_days: int = DIARIZATION_CACHE_MAX_AGE_DAYS) -> int:
+    """Delete cached speaker assignments older than max_age_days; returns how many."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for path in DIARIZATION_CACHE_DIR.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
+
 
 class LLMDiarizer:
     
-    def __init__(self, model: str = "llama-3.3-70b-versatile"):
+    def __init__(self, model: str = "llama-3.3-70b-versatile", client: Optional[AsyncGroq] = None):
         self.model = model
-        self.client = None
-        self._initialize_client()
+        self.client = client
+        self._http_client = None
+        if self.client is None:
+            self._initialize_client()
     
     def _initialize_client(self) -> bool:
         api_key = os.environ.get("GROQ_API_KEY")
@@ -21,13 +72,33 @@ class LLMDiarizer:
             return False
         
         try:
-            self.client = Groq(api_key=api_key)
+            # Persistent keep-alive pool so concurrent chunk requests share TCP/TLS sessions
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(600.0),
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=16)
+            )
+            self.client = AsyncGroq(api_key=api_key, http_client=self._http_client)
             return True
         except Exception as e:
             logger.error(f"Failed to initialize Groq client: {e}")
+            self._http_client = None
+            self.client = None
             return False
     
-    def diarize_transcript(self, transcript: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def aclose(self) -> None:
+        # Only the connection pool created here is closed; an injected client is shared
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self.client = None
+    
+    async def __aenter__(self) -> "LLMDiarizer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def diarize_transcript(self, transcript: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         if not self.client:
             logger.warning("Groq client not available. Returning transcript without diarization.")
             return transcript
@@ -35,12 +106,34 @@ class LLMDiarizer:
         if not transcript:
             return transcript
         
+        # The same transcript (e.g. a re-processed upload) gets the same assignments
+        cache_key = self._cache_key(transcript)
+        cached = self._load_cached_assignments(cache_key)
+        if cached is not None:
+            logger.info("Using cached speaker assignments")
+            return self._apply_speaker_assignments(transcript, cached)
+        
         try:
-            # Prepare transcript text for analysis
-            transcript_text = self._format_transcript_for_analysis(transcript)
+            # Analyze fixed-size chunks concurrently; each one (after the first) starts
+            # with the last few segments of the previous chunk
+            starts = range(0, len(transcript), CHUNK_SEGMENTS)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            
+            async def analyze_chunk(start: int) -> Dict[int, str]:
+                first = max(0, start - CHUNK_OVERLAP)
+                end = min(start + CHUNK_SEGMENTS, len(transcript))
+                transcript_text = self._format_transcript_for_analysis(transcript, first, end)
+                async with semaphore:
+                    return await self._analyze_speakers(transcript_text, first, end)
             
-            # Get speaker assignments from LLM
-            speaker_assignments = self._analyze_speakers(transcript_text, len(transcript))
+            chunk_assignments = await asyncio.gather(*(analyze_chunk(start) for start in starts))
+            
+            # Get speaker assignments from LLM, with labels made consistent across chunks
+            speaker_assignments = self._merge_chunk_assignments(chunk_assignments)
+            
+            # Only complete results are cached; failed chunks come back empty
+            if all(chunk_assignments):
+                self._store_assignments(cache_key, speaker_assignments)
             
             # Apply speaker assignments to transcript
             updated_transcript = self._apply_speaker_assignments(transcript, speaker_assignments)
@@ -52,16 +145,91 @@ class LLMDiarizer:
             # Return original transcript on error
             return transcript
     
-    def _format_transcript_for_analysis(self, transcript: List[Dict[str, Any]]) -> str:
-        lines = []
-        for i, seg in enumerate(transcript):
-            text = seg.get("text", "").strip()
-            start = seg.get("start", 0)
-            end = seg.get("end", 0)
-            lines.append(f"[{i}] ({start:.1f}s - {end:.1f}s): {text}")
-        return "\n".join(lines)
+    def _cache_key(self, transcript: List[Dict[str, Any]]) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model.encode("utf-8"))
+        for seg in transcript:
+            digest.update(b"\x00")
+            digest.update(seg.get("text", "").encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _load_cached_assignments(self, cache_key: str) -> Optional[Dict[int, str]]:
+        assignments = _assignment_cache.get(cache_key)
+        if assignments is not None:
+            _assignment_cache.move_to_end(cache_key)
+            return assignments
+        
+        cache_file = DIARIZATION_CACHE_DIR / f"{cache_key}.json"
+        try:
+            with open(cache_file, "rb") as f:
+                assignments = {int(k): v for k, v in orjson.loads(f.read()).items()}
+        except (OSError, ValueError, AttributeError):
+            return None
+        
+        self._remember_assignments(cache_key, assignments)
+        return assignments
+    
+    def _store_assignments(self, cache_key: str, assignments: Dict[int, str]) -> None:
+        self._remember_assignments(cache_key, assignments)
+        
+        # Write to a temporary file first so readers never see a partial entry
+        cache_file = DIARIZATION_CACHE_DIR / f"{cache_key}.json"
+        tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(assignments, option=orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write diarization cache entry: {e}")
+            tmp_file.unlink(missing_ok=True)
+    
+    def _remember_assignments(self, cache_key: str, assignments: Dict[int, str]) -> None:
+        _assignment_cache[cache_key] = assignments
+        _assignment_cache.move_to_end(cache_key)
+        while len(_assignment_cache) > MEMORY_CACHE_SIZE:
+            _assignment_cache.popitem(last=False)
+    
+    def _format_transcript_for_analysis(
+        self,
+        transcript: List[Dict[str, Any]],
+        first: int = 0,
+        end: Optional[int] = None
+    ) -> str:
+        # Segments keep their global indices, so chunk results need no offset. Timestamps
+        # are left out: speakers are told apart from the text, and they cost input tokens.
+        return "\n".join(
+            f"[{i}] {seg.get('text', '').strip()}"
+            for i, seg in enumerate(transcript[first:end], first)
+        )
     
-    def _analyze_speakers(self, transcript_text: str, segment_count: int) -> Dict[int, str]:
+    def _merge_chunk_assignments(self, chunk_assignments: List[Dict[int, str]]) -> Dict[int, str]:
+        merged: Dict[int, str] = {}
+        for assignments in chunk_assignments:
+            # Rename this chunk's labels to the labels the overlapping segments already
+            # have, most frequent pairing first; the earlier chunk wins on conflicts
+            votes = Counter(
+                (label, merged[i]) for i, label in assignments.items() if i in merged
+            )
+            renames: Dict[str, str] = {}
+            for (label, previous), _ in votes.most_common():
+                if label not in renames and previous not in renames.values():
+                    renames[label] = previous
+            
+            # A generic label with no overlap match is a speaker not seen before, even if
+            # an earlier chunk used the same label for someone else: give it a free one.
+            # Real names are kept, since they identify the person across chunks.
+            used = set(merged.values()) | set(renames.values())
+            for label in dict.fromkeys(assignments.values()):
+                if label not in renames and label.startswith("Speaker_") and label in used:
+                    renames[label] = _free_speaker_label(used)
+                    used.add(renames[label])
+            
+            for i, label in assignments.items():
+                if i not in merged:
+                    merged[i] = renames.get(label, label)
+        return merged
+    
+    async def _analyze_speakers(self, transcript_text: str, first: int, end: int) -> Dict[int, str]:
         system_prompt = """You are an expert at analyzing conversation transcripts and identifying different speakers.
 
 Your task is to analyze the transcript and identify which segments belong to which speaker.
@@ -87,36 +255,32 @@ Do not include any explanation, just the JSON object."""
 
 {transcript_text}
 
-Return a JSON object mapping each segment index (0 to {segment_count - 1}) to a speaker identifier.
+Return a JSON object mapping each segment index ({first} to {end - 1}) to a speaker identifier.
 Use actual names if mentioned in the conversation, otherwise use Speaker_A, Speaker_B, etc."""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.1,  # Low temperature for consistent results
-                max_tokens=4096
+                temperature=0,  # Deterministic assignments
+                # Room for one '"index": "label"' entry per segment, and no more
+                max_tokens=min(4096, 16 + TOKENS_PER_SEGMENT * (end - first)),
+                response_format={"type": "json_object"}
             )
             
-            result_text = response.choices[0].message.content.strip()
+            result_text = response.choices[0].message.content
             
-            # Parse JSON response
-            # Handle potential markdown code blocks
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
-                result_text = result_text.strip()
+            # Parse JSON response (JSON mode returns a bare object, no code fences)
+            speaker_map = orjson.loads(result_text)
             
-            speaker_map = json.loads(result_text)
+            # Convert string keys to integers, keeping only this chunk's segments
+            assignments = {int(k): v for k, v in speaker_map.items()}
+            return {i: v for i, v in assignments.items() if first <= i < end}
             
-            # Convert string keys to integers
-            return {int(k): v for k, v in speaker_map.items()}
-            
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response as JSON: {e}")
             logger.debug(f"Response was: {result_text}")
             return {}
@@ -129,20 +293,12 @@ Use actual names if mentioned in the conversation, otherwise use Speaker_A, Spea
         transcript: List[Dict[str, Any]], 
         assignments: Dict[int, str]
     ) -> List[Dict[str, Any]]:
-        updated = []
-        for i, seg in enumerate(transcript):
-            new_seg = seg.copy()
-            if i in assignments:
-                new_seg["speaker"] = assignments[i]
-            else:
-                # Default speaker if not assigned
-                new_seg["speaker"] = f"Speaker_{i % 10}"
-            updated.append(new_seg)
-        return updated
+        # Copies keep the caller's segments untouched; unassigned segments get a
+        # default speaker
+        return [
+            {**seg, "speaker": assignments.get(i, DEFAULT_SPEAKERS[i % 10])}
+            for i, seg in enumerate(transcript)
+        ]
     
     def get_unique_speakers(self, transcript: List[Dict[str, Any]]) -> List[str]:
-        speakers = set()
-        for seg in transcript:
-            speaker = seg.get("speaker", "Unknown")
-            speakers.add(speaker)
-        return sorted(list(speakers))
+        return sorted({seg.get("speaker", "Unknown") for seg in transcript})
@@ -1,9 +1,12 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from config import CORS_ORIGINS
 from database import create_tables
+from llm_diarization import prune_diarization_cache
+from llm_client import close_groq_client
 from routes import meetings, assignees, jira
 from routes.auth import router as auth_router
 
@@ -13,8 +16,13 @@ async def lifespan(app: FastAPI):
     # Startup: Create database tables
     await create_tables()
     print("Database tables created/verified")
+    # Startup: Drop expired diarization cache entries
+    removed = prune_diarization_cache()
+    if removed:
+        print(f"Removed {removed} expired diarization cache entries")
     yield
-    # Shutdown: Nothing to do
+    # Shutdown: Close the shared LLM connection pool
+    await close_groq_client()
     print("Shutting down...")
 
 
@@ -23,7 +31,8 @@ app = FastAPI(
     title="Meeting Assistant API",
     description="AI-powered meeting transcription, summarization, and task extraction",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # Serialize response bodies with orjson
 )
 
 # Configure CORS
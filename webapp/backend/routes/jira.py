@@ -1,6 +1,7 @@
-from typing import List
+from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
 import re
+import time
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -13,6 +14,12 @@ from auth import get_current_user
 
 router = APIRouter()
 
+# Jira user directories by credentials, reused for a few minutes so pushing tasks does
+# not download up to 1000 users on every request; new credentials always miss
+JIRA_USERS_TTL = 300
+JIRA_USERS_CACHE_SIZE = 256
+_jira_users_cache: Dict[Tuple[str, str, str], Tuple[float, list]] = {}
+
 
 # Day name mappings
 DAY_NAMES = {
@@ -247,9 +254,9 @@ async def save_jira_config(
     
     await db.flush()
     
-    # Test connection
+    # Test connection (always against Jira, not the cached directory)
     try:
-        users = await fetch_jira_users_internal(jira_conf)
+        users = await fetch_jira_users_internal(jira_conf, refresh=True)
         return {"status": "success", "message": f"Connected! Found {len(users)} users."}
     except Exception as e:
         # Rollback on failure
@@ -294,7 +301,12 @@ async def delete_jira_config(
     return {"status": "success"}
 
 
-async def fetch_jira_users_internal(jira_conf: JiraConfiguration) -> List[JiraUser]:
+async def fetch_jira_users_raw(jira_conf: JiraConfiguration, refresh: bool = False) -> list:
+    key = (jira_conf.domain, jira_conf.email, jira_conf.api_token)
+    cached = _jira_users_cache.get(key)
+    if cached and not refresh and time.monotonic() - cached[0] < JIRA_USERS_TTL:
+        return cached[1]
+    
     async with httpx.AsyncClient() as client:
         response = await client.get(
             f"https://{jira_conf.domain}/rest/api/3/users/search",
@@ -305,16 +317,25 @@ async def fetch_jira_users_internal(jira_conf: JiraConfiguration) -> List[JiraUs
         if response.status_code != 200:
             raise HTTPException(status_code=response.status_code, detail="Jira API error")
         
-        users = []
-        for user in response.json():
-            if user.get('accountType') == 'atlassian':
-                users.append(JiraUser(
-                    account_id=user['accountId'],
-                    display_name=user.get('displayName', ''),
-                    email=user.get('emailAddress'),
-                    avatar_url=user.get('avatarUrls', {}).get('48x48')
-                ))
-        return users
+        users = response.json()
+    
+    if key not in _jira_users_cache and len(_jira_users_cache) >= JIRA_USERS_CACHE_SIZE:
+        _jira_users_cache.pop(next(iter(_jira_users_cache)))
+    _jira_users_cache[key] = (time.monotonic(), users)
+    return users
+
+
+async def fetch_jira_users_internal(jira_conf: JiraConfiguration, refresh: bool = False) -> List[JiraUser]:
+    users = []
+    for user in await fetch_jira_users_raw(jira_conf, refresh):
+        if user.get('accountType') == 'atlassian':
+            users.append(JiraUser(
+                account_id=user['accountId'],
+                display_name=user.get('displayName', ''),
+                email=user.get('emailAddress'),
+                avatar_url=user.get('avatarUrls', {}).get('48x48')
+            ))
+    return users
 
 
 @router.get("/users", response_model=List[JiraUser])
@@ -422,16 +443,10 @@ async def create_jira_issues(
     
     # Fetch Jira users for auto-assignment
     jira_users = []
-    async with httpx.AsyncClient() as client:
-        try:
-            users_response = await client.get(
-                f"https://{jira_conf.domain}/rest/api/3/users/search?maxResults=1000",
-                auth=(jira_conf.email, jira_conf.api_token)
-            )
-            if users_response.status_code == 200:
-                jira_users = users_response.json()
-        except:
-            pass
+    try:
+        jira_users = await fetch_jira_users_raw(jira_conf)
+    except:
+        pass
     
     # Fetch all tasks for this meeting at once to prevent N+1
     all_tasks_result = await db.execute(
@@ -1,9 +1,10 @@
 import uuid
-import shutil
+import aiofiles
 from pathlib import Path
 from datetime import datetime
 from typing import Dict
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
@@ -15,6 +16,8 @@ from auth import get_current_user
 
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 # In-memory job status tracking (for real-time updates during processing)
 processing_jobs: Dict[str, dict] = {}
 
@@ -39,10 +42,11 @@ async def upload_file(
     # Generate job ID
     job_id = str(uuid.uuid4())[:8]
     
-    # Save file
+    # Save file in fixed-size chunks so large uploads don't block the event loop
     file_path = UPLOAD_DIR / f"{job_id}{file_ext}"
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
     
     # Create meeting record in database
     meeting = Meeting(
@@ -145,7 +149,9 @@ async def get_results(
     )
     tasks = tasks_result.scalars().all()
     
-    return {
+    # Everything here is already JSON-native, so hand it straight to orjson instead of
+    # letting FastAPI walk the (potentially very long) transcript with jsonable_encoder
+    return ORJSONResponse({
         "job_id": meeting.job_id,
         "filename": meeting.filename,
         "duration": meeting.duration,
@@ -169,7 +175,7 @@ async def get_results(
         ],
         "created_at": meeting.created_at.isoformat(),
         "processing_time": meeting.processing_time,
-    }
+    })
 
 
 @router.get("/results")
@@ -251,22 +257,22 @@ async def update_task(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # Verify meeting belongs to user
+    # Verify meeting belongs to user (only the id; the row carries the transcript and summary)
     meeting_result = await db.execute(
-        select(Meeting).where(
+        select(Meeting.id).where(
             Meeting.job_id == job_id,
             Meeting.user_id == current_user.id
         )
     )
-    meeting = meeting_result.scalar_one_or_none()
+    meeting_id = meeting_result.scalar_one_or_none()
     
-    if not meeting:
+    if not meeting_id:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     # Find and update task
     task_result = await db.execute(
         select(Task).where(
-            Task.meeting_id == meeting.id,
+            Task.meeting_id == meeting_id,
             Task.task_id == task_id
         )
     )
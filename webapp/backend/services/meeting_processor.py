@@ -10,11 +10,13 @@ from speech_recognition import MeetingTranscriber
 from summarization.llm_summarizer import LLMSummarizer
 from action_item_extraction.ml_extractor import LLMActionItemExtractor
 from llm_diarization import LLMDiarizer
+from llm_client import get_groq_client
+from combined_analysis import CombinedAnalyzer
 
-from config import WHISPER_MODEL
+from config import WHISPER_MODEL, WHISPER_BACKEND, DIARIZER_MODEL
 from database import async_session
 from db_models import Meeting, Task
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 # Import processing_jobs from meetings route
 from routes.meetings import processing_jobs
@@ -25,17 +27,13 @@ async def update_job_status(job_id: str, **kwargs):
     if job_id in processing_jobs:
         processing_jobs[job_id].update(kwargs)
     
-    # Update in database
+    # Update in database with a single UPDATE (no SELECT of the row first)
+    values = {key: value for key, value in kwargs.items() if key in Meeting.__table__.columns}
     async with async_session() as session:
-        result = await session.execute(
-            select(Meeting).where(Meeting.job_id == job_id)
+        await session.execute(
+            update(Meeting).where(Meeting.job_id == job_id).values(**values)
         )
-        meeting = result.scalar_one_or_none()
-        if meeting:
-            for key, value in kwargs.items():
-                if hasattr(meeting, key):
-                    setattr(meeting, key, value)
-            await session.commit()
+        await session.commit()
 
 
 async def process_meeting_db(job_id: str, file_path: Path, filename: str, user_id: str):
@@ -50,26 +48,25 @@ async def process_meeting_db(job_id: str, file_path: Path, filename: str, user_i
             message="Transcribing audio with Whisper..."
         )
         
-        transcriber = MeetingTranscriber(
-            model_name=WHISPER_MODEL,
-            language=None,
-            enable_speaker_diarization=False
-        )
+        # Model loading and Whisper inference run in a worker thread so the event
+        # loop keeps serving requests (including this job's status polling)
+        def transcribe():
+            transcriber = MeetingTranscriber(
+                model_name=WHISPER_MODEL,
+                language=None,
+                enable_speaker_diarization=False,
+                backend=WHISPER_BACKEND
+            )
+            return transcriber.transcribe_audio(
+                str(file_path),
+                segment_by_speaker=False
+            )
         
-        transcript_result = transcriber.transcribe_audio(
-            str(file_path),
-            segment_by_speaker=False
-        )
+        transcript_result = await asyncio.to_thread(transcribe)
         
         if transcript_result.get("status") == "error":
             raise Exception(transcript_result.get("message", "Transcription failed"))
         
-        await update_job_status(
-            job_id, 
-            progress=35, 
-            message="Transcription complete. Generating summary..."
-        )
-        
         # Convert to standard format
         raw_transcript = [
             {
@@ -89,46 +86,45 @@ async def process_meeting_db(job_id: str, file_path: Path, filename: str, user_i
             "transcript": raw_transcript
         }
         
-        # Step 2: Summarization
+        # Steps 2 and 3: Summary and tasks come from a single LLM request when the
+        # transcript allows it; otherwise the two independent requests run at the same time
         await update_job_status(
             job_id, 
             step="summarization", 
             progress=40, 
-            message="Generating summary..."
+            message="Transcription complete. Generating summary..."
         )
         
-        summarizer = LLMSummarizer()
-        summary_result = summarizer.summarize(transcript_data)
+        groq_client = get_groq_client()
+        summarizer = LLMSummarizer(async_client=groq_client)
+        extractor = LLMActionItemExtractor(async_client=groq_client)
+        
+        async def summarize():
+            result = await summarizer.asummarize(transcript_data)
+            await update_job_status(
+                job_id, 
+                step="extraction", 
+                progress=60, 
+                message="Summary generated. Extracting tasks..."
+            )
+            return result
+        
+        combined = await CombinedAnalyzer(summarizer, extractor).analyze(transcript_data)
+        if combined is not None:
+            summary_result, tasks_result = combined
+        else:
+            summary_result, tasks_result = await asyncio.gather(
+                summarize(),
+                extractor.aextract_action_items(transcript_data)
+            )
         summary_dict = summarizer.to_dict(summary_result)
         
-        await update_job_status(
-            job_id, 
-            progress=55, 
-            message="Summary generated. Extracting tasks..."
-        )
-        
-        # Step 3: Task Extraction
-        await update_job_status(
-            job_id, 
-            step="extraction", 
-            progress=60
-        )
-        
-        extractor = LLMActionItemExtractor()
-        tasks_result = extractor.extract_action_items(transcript_data)
-        
-        await update_job_status(
-            job_id, 
-            progress=80, 
-            message="Tasks extracted. Identifying speakers..."
-        )
-        
         # Step 4: LLM-based Speaker Diarization
         await update_job_status(
             job_id, 
             step="diarization", 
             progress=90, 
-            message="Analyzing speakers with AI..."
+            message="Tasks extracted. Identifying speakers..."
         )
         
         # Add speaker field for diarization
@@ -142,8 +138,8 @@ async def process_meeting_db(job_id: str, file_path: Path, filename: str, user_i
             for seg in raw_transcript
         ]
         
-        diarizer = LLMDiarizer()
-        diarized_transcript = diarizer.diarize_transcript(transcript_for_diarization)
+        async with LLMDiarizer(model=DIARIZER_MODEL, client=groq_client) as diarizer:
+            diarized_transcript = await diarizer.diarize_transcript(transcript_for_diarization)
         
         # Step 5: Save to database
         processing_time = (datetime.now() - start_time).total_seconds()
@@ -184,16 +180,6 @@ async def process_meeting_db(job_id: str, file_path: Path, filename: str, user_i
                 
                 await session.commit()
         
-        # Update in-memory status
-        if job_id in processing_jobs:
-            processing_jobs[job_id].update({
-                "status": "completed",
-                "step": "done",
-                "progress": 100,
-                "message": "Processing complete!",
-                "completed_at": datetime.now().isoformat()
-            })
-        
     except Exception as e:
         # Update error status
         await update_job_status(
@@ -202,15 +188,12 @@ async def process_meeting_db(job_id: str, file_path: Path, filename: str, user_i
             error=str(e),
             message=f"Error: {str(e)}"
         )
-        if job_id in processing_jobs:
-            processing_jobs[job_id].update({
-                "status": "failed",
-                "error": str(e),
-                "message": f"Error: {str(e)}"
-            })
         raise
     
     finally:
+        # The final state is in the database now, so drop the in-memory entry;
+        # otherwise finished jobs would accumulate for the life of the process
+        processing_jobs.pop(job_id, None)
+        
         # Cleanup uploaded file
-        if file_path.exists():
-            file_path.unlink()
+        file_path.unlink(missing_ok=True)
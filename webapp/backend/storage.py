@@ -1,4 +1,4 @@
-import json
+import orjson
 from typing import Dict, Any
 from pathlib import Path
 from config import CONFIG_FILE
@@ -14,17 +14,17 @@ assignee_mappings: Dict[str, Dict[str, str]] = {}  # job_id -> {extracted_name:
 
 def load_storage():
     if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'r') as f:
-            data = json.load(f)
+        with open(CONFIG_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
             jira_config.update(data.get('jira_config', {}))
             user_mappings.update(data.get('user_mappings', {}))
             assignee_mappings.update(data.get('assignee_mappings', {}))
 
 
 def save_storage():
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump({
+    with open(CONFIG_FILE, 'wb') as f:
+        f.write(orjson.dumps({
             'jira_config': jira_config,
             'user_mappings': user_mappings,
             'assignee_mappings': assignee_mappings
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2))
@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("groq")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from llm_diarization import LLMDiarizer
+
+
+@pytest.fixture
+def diarizer():
+    # An injected client keeps the diarizer from needing an API key
+    return LLMDiarizer(client=object())
+
+
+def test_merge_renames_chunk_labels_by_overlap(diarizer):
+    first = {0: "Speaker_A", 1: "Speaker_B", 2: "Speaker_A", 3: "Speaker_B"}
+    # Same two speakers, but the second chunk swapped their labels
+    second = {2: "Speaker_B", 3: "Speaker_A", 4: "Speaker_B", 5: "Speaker_A"}
+
+    merged = diarizer._merge_chunk_assignments([first, second])
+
+    assert merged == {0: "Speaker_A", 1: "Speaker_B", 2: "Speaker_A", 3: "Speaker_B", 4: "Speaker_A", 5: "Speaker_B"}
+
+
+def test_merge_gives_unmatched_label_a_free_name(diarizer):
+    first = {0: "Speaker_A", 1: "Speaker_B", 2: "Speaker_A", 3: "Speaker_B"}
+    # The old Speaker_B is now "Speaker_A", and "Speaker_B" is someone new
+    second = {3: "Speaker_A", 4: "Speaker_A", 5: "Speaker_B"}
+
+    merged = diarizer._merge_chunk_assignments([first, second])
+
+    assert merged[4] == "Speaker_B"
+    assert merged[5] not in {"Speaker_A", "Speaker_B"}
+
+
+def test_merge_keeps_real_names_without_overlap(diarizer):
+    first = {0: "John", 1: "Sarah"}
+    second = {2: "John", 3: "Mike"}
+
+    merged = diarizer._merge_chunk_assignments([first, second])
+
+    assert merged == {0: "John", 1: "Sarah", 2: "John", 3: "Mike"}